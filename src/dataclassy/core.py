@@ -1,14 +1,46 @@
 """Core dataclassy decorator implementation."""
 
-from dataclasses import dataclass, fields, asdict
+from dataclasses import dataclass, fields
 from enum import Enum
-from typing import Any, Optional, Type, TypeVar, Union, get_type_hints
+from typing import Any, Callable, Optional, Tuple, Type, TypeVar, Union
 
-from .utils import enum_converter
+from .serialization.converter import Converter
+from .serialization.formats import FormatHandler
+from .utils import cached_type_hints, enum_converter
 
 T = TypeVar("T")
 
 
+def _enum_fields(cls: type) -> Tuple[Tuple[str, type, Callable], ...]:
+    """
+    Get the enum-typed fields of a class with their converters.
+
+    Resolved once per class and stored on it, so __post_init__ only loops
+    over the fields that actually need conversion.
+
+    Args:
+        cls: The dataclass type
+
+    Returns:
+        Tuple of (name, enum type, converter) for each enum field
+    """
+    enum_fields = cls.__dict__.get("__dataclassy_enum_fields__")
+    if enum_fields is None:
+        type_hints = cached_type_hints(cls)
+        enum_fields = []
+        for field in fields(cls):
+            # Get the actual type from type hints
+            field_type = type_hints.get(field.name, field.type)
+
+            if isinstance(field_type, type) and issubclass(field_type, Enum):
+                enum_fields.append(
+                    (field.name, field_type, enum_converter(field_type))
+                )
+        enum_fields = tuple(enum_fields)
+        cls.__dataclassy_enum_fields__ = enum_fields
+    return enum_fields
+
+
 def dataclassy(
     cls: Optional[Type[T]] = None,
     *,
@@ -39,38 +71,25 @@ def dataclassy(
 
         def enhanced_post_init(self) -> None:
             """Enhanced post-init that handles type conversions."""
-            # Get type hints for the class
-            type_hints = get_type_hints(self.__class__)
-
-            # Run field conversions
-            for field in fields(self):
-                value = getattr(self, field.name)
+            # Run enum conversions
+            for name, field_type, converter in _enum_fields(self.__class__):
+                value = getattr(self, name)
 
-                # Skip None values
-                if value is None:
+                # Skip None values and values that are already members
+                if value is None or isinstance(value, field_type):
                     continue
 
-                # Get the actual type from type hints
-                field_type = type_hints.get(field.name, field.type)
-
-                # Check if field type is an Enum
-                if isinstance(field_type, type) and issubclass(
-                    field_type, Enum
-                ):
-                    if not isinstance(value, field_type):
-                        try:
-                            converter = enum_converter(field_type)
-                            converted = converter(value)
-                            if frozen:
-                                # Use object.__setattr__ for frozen instances
-                                object.__setattr__(self, field.name, converted)
-                            else:
-                                setattr(self, field.name, converted)
-                        except ValueError as e:
-                            # Raise a more informative error
-                            raise ValueError(
-                                f"Invalid value for {field.name}: {e}"
-                            ) from e
+                try:
+                    converted = converter(value)
+                except ValueError as e:
+                    # Raise a more informative error
+                    raise ValueError(f"Invalid value for {name}: {e}") from e
+
+                if frozen:
+                    # Use object.__setattr__ for frozen instances
+                    object.__setattr__(self, name, converted)
+                else:
+                    setattr(self, name, converted)
 
             # Call original __post_init__ if exists
             if original_post_init:
@@ -83,9 +102,9 @@ def dataclassy(
                 # (though Python should do this automatically)
                 pass
 
-        # Set __post_init__ BEFORE applying dataclass decorator
-        if not slots:
-            cls.__post_init__ = enhanced_post_init
+        # Set __post_init__ BEFORE applying dataclass decorator; with
+        # slots=True, dataclass copies it onto the slotted class it builds
+        cls.__post_init__ = enhanced_post_init
 
         # Apply standard dataclass decorator
         cls = dataclass(
@@ -105,28 +124,19 @@ def dataclassy(
         @classmethod
         def from_dict(cls: Type[T], data: dict) -> T:
             """Create instance from dictionary."""
-            # Import here to avoid circular imports
-            from .serialization.converter import Converter
-
             return Converter.from_dict(cls, data)
 
         def to_dict(self) -> dict:
             """Convert instance to dictionary."""
-            return asdict(self)
+            return Converter.to_dict(self)
 
         @classmethod
         def from_path(cls: Type[T], path: Union[str, Any]) -> T:
             """Load instance from file path."""
-            # Import here to avoid circular imports
-            from .serialization.formats import FormatHandler
-
             return FormatHandler.from_path(cls, path)
 
         def to_path(self, path: Union[str, Any]) -> None:
             """Save instance to file path."""
-            # Import here to avoid circular imports
-            from .serialization.formats import FormatHandler
-
             FormatHandler.to_path(self, path)
 
         # Add methods to class
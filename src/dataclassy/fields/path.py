@@ -1,5 +1,7 @@
 """Path field type for dataclassy."""
 
+import os
+import stat
 from pathlib import Path as PathLib
 from typing import Any, Callable, List, Optional
 
@@ -44,7 +46,10 @@ class Path(Validator):
             resolve: Whether to resolve the path to absolute
             expanduser: Whether to expand ~ to user home directory
             create_parents: Whether to create parent directories if they don't exist
-            parse_callback: Optional callback to parse/load file contents
+            parse_callback: Optional callback to parse/load file contents.
+                Setting the same unchanged file again (same path, mtime and
+                size) reuses the previous result object instead of calling
+                it again.
             parsed_attr: Name of attribute to store parsed data (default: field_name + '_data')
             raise_parse_errors: Whether to raise exceptions from parse_callback
         """
@@ -53,6 +58,8 @@ class Path(Validator):
         self.is_file = is_file
         self.is_dir = is_dir
         self.extensions = extensions
+        # Set form of extensions for constant-time membership checks
+        self._extension_set = frozenset(extensions) if extensions else None
         self.resolve = resolve
         self.expanduser = expanduser
         self.create_parents = create_parents
@@ -64,6 +71,24 @@ class Path(Validator):
         if is_file and is_dir:
             raise ValueError("Path cannot be both file and directory")
 
+    def __set_name__(self, owner: type, name: str) -> None:
+        """
+        Called when the descriptor is assigned to a class attribute.
+
+        Also resolves the instance attribute names used by parse_callback,
+        so setting a value doesn't rebuild them each time. Besides the
+        parsed data attribute, parse_callback uses a private
+        `_<name>_parse_cache` attribute remembering the last result.
+
+        Args:
+            owner: The class that owns this descriptor
+            name: The name of the attribute
+        """
+        super().__set_name__(owner, name)
+        # Default: use the public field name + '_data'
+        self._parsed_attr_name = self.parsed_attr or name + "_data"
+        self._parse_cache_attr = self.private_name + "_parse_cache"
+
     def convert(self, value: Any) -> PathLib:
         """
         Convert value to pathlib.Path.
@@ -124,24 +149,31 @@ class Path(Validator):
                 f"got {type(value).__name__}"
             )
 
-        # Check existence
-        if self.must_exist and not value.exists():
-            raise ValueError(f"{self.public_name} does not exist: {value}")
+        # One stat() covers existence, file type and directory checks
+        try:
+            st = value.stat()
+        except OSError:
+            st = None
 
-        # Skip further checks if path doesn't exist
-        if not value.exists():
+        # Check existence
+        if st is None:
+            if self.must_exist:
+                raise ValueError(f"{self.public_name} does not exist: {value}")
+            # Skip further checks if path doesn't exist
             return
 
+        is_regular_file = stat.S_ISREG(st.st_mode)
+
         # Check file type
-        if self.is_file is True and not value.is_file():
+        if self.is_file is True and not is_regular_file:
             raise ValueError(f"{self.public_name} must be a file: {value}")
 
-        if self.is_dir is True and not value.is_dir():
+        if self.is_dir is True and not stat.S_ISDIR(st.st_mode):
             raise ValueError(f"{self.public_name} must be a directory: {value}")
 
         # Check extensions
-        if self.extensions and value.is_file():
-            if value.suffix not in self.extensions:
+        if self._extension_set is not None and is_regular_file:
+            if value.suffix not in self._extension_set:
                 raise ValueError(
                     f"{self.public_name} must have extension in {self.extensions}, "
                     f"got {value.suffix}"
@@ -161,27 +193,47 @@ class Path(Validator):
         # If parse_callback is provided, load and parse the file
         if self.parse_callback and value is not None:
             path = getattr(obj, self.private_name)
-            if path and path.exists() and path.is_file():
-                # Determine the attribute name for parsed data
-                if self.parsed_attr:
-                    parsed_attr = self.parsed_attr
-                else:
-                    # Default: use the public field name + '_data'
-                    parsed_attr = self.public_name + "_data"
-
-                try:
-                    # Call the parse callback with the path
-                    parsed_data = self.parse_callback(path)
-                    # Store the parsed data
-                    setattr(obj, parsed_attr, parsed_data)
-                except Exception as e:
-                    if self.raise_parse_errors:
-                        raise ValueError(
-                            f"Failed to parse {self.public_name}: {e}"
-                        ) from e
-                    else:
-                        # Store None if parsing fails and we're not raising
-                        setattr(obj, parsed_attr, None)
+            if not path:
+                return
+
+            # A single stat() answers both "exists" and "is a file"
+            try:
+                st = os.stat(path)
+            except OSError:
+                return
+            if not stat.S_ISREG(st.st_mode):
+                return
+
+            parsed_attr = self._parsed_attr_name
+            cache_attr = self._parse_cache_attr
+
+            # Reuse the last result if the same unchanged file is set again.
+            # The parsed object itself is reused, not a copy, so changes
+            # made to it are still there after such a set.
+            cache_key = (path, st.st_mtime_ns, st.st_size)
+            cached = getattr(obj, cache_attr, None)
+            if cached is not None:
+                if cached[0] == cache_key:
+                    setattr(obj, parsed_attr, cached[1])
+                    return
+                delattr(obj, cache_attr)
+
+            try:
+                # Call the parse callback with the path
+                parsed_data = self.parse_callback(path)
+            except Exception as e:
+                if self.raise_parse_errors:
+                    raise ValueError(
+                        f"Failed to parse {self.public_name}: {e}"
+                    ) from e
+                # Store None if parsing fails and we're not raising;
+                # failures aren't cached, so the next set tries again
+                setattr(obj, parsed_attr, None)
+                return
+
+            # Store the parsed data
+            setattr(obj, parsed_attr, parsed_data)
+            setattr(obj, cache_attr, (cache_key, parsed_data))
 
     def read_text(self, obj: Any, encoding: str = "utf-8") -> Optional[str]:
         """
@@ -1,22 +1,30 @@
 """Type-aware conversion between dictionaries and dataclasses."""
 
+import copy
+import sys
 from dataclasses import fields, is_dataclass, MISSING
 from enum import Enum
+from functools import lru_cache
 from typing import (
     Any,
+    Callable,
     Dict,
+    Optional,
+    Tuple,
     Type,
     TypeVar,
     Union,
-    get_type_hints,
     get_origin,
     get_args,
 )
 
-from ..utils import enum_converter
+from ..utils import cached_type_hints, enum_converter
 
 T = TypeVar("T")
 
+# enum_converter() builds lookup tables, so share one converter per enum
+_enum_converter = lru_cache(maxsize=None)(enum_converter)
+
 
 class Converter:
     """Handles conversion between dictionaries and dataclass instances."""
@@ -45,80 +53,221 @@ class Converter:
             TypeError: If cls is not a dataclass
             ValueError: If required fields are missing
         """
-        if not is_dataclass(cls):
-            if data is None:
-                return None
-            return data
+        # Classes that were converted before carry their loader
+        loader = getattr(cls, "__dict__", {}).get("__dataclassy_from_dict__")
+        if loader is None:
+            if not is_dataclass(cls):
+                if data is None:
+                    return None
+                return data
+            loader = Converter._loader(cls)
 
         if data is None:
             return None
 
-        # Get type hints for better type information
-        type_hints = get_type_hints(cls)
-        init_kwargs = {}
-
-        # Process each field
-        for field in fields(cls):
-            field_name = field.name
-            field_value = data.get(field_name, MISSING)
-
-            # Handle missing fields
-            if field_value is MISSING:
-                if field.default is not MISSING:
-                    init_kwargs[field_name] = field.default
-                elif field.default_factory is not MISSING:
-                    init_kwargs[field_name] = field.default_factory()
-                elif (
-                    field.default is MISSING
-                    and field.default_factory is MISSING
+        return loader(data)
+
+    @staticmethod
+    def _loader(cls: Type[T]) -> Callable[[Dict[str, Any]], T]:
+        """
+        Get the from_dict function specialized for a dataclass.
+
+        The function is built once per class from its field plan and stored
+        on the class. Fields whose converter would return values unchanged
+        skip the converter call entirely.
+
+        Args:
+            cls: The dataclass type
+
+        Returns:
+            A function converting a dictionary to an instance of cls
+        """
+        loader = cls.__dict__.get("__dataclassy_from_dict__")
+        if loader is not None:
+            return loader
+
+        steps = tuple(
+            (
+                field_name,
+                None if convert is _identity else convert,
+                strict_type,
+                default,
+                default_factory,
+            )
+            for field_name, convert, strict_type, default, default_factory in (
+                Converter._field_plan(cls)
+            )
+        )
+
+        def loader(data: Dict[str, Any]) -> T:
+            init_kwargs = {}
+
+            # Process each field
+            for (
+                field_name,
+                convert,
+                strict_type,
+                default,
+                default_factory,
+            ) in steps:
+                field_value = data.get(field_name, MISSING)
+
+                # Handle missing fields
+                if field_value is MISSING:
+                    if default is not MISSING:
+                        init_kwargs[field_name] = default
+                    elif default_factory is not MISSING:
+                        init_kwargs[field_name] = default_factory()
+                    else:
+                        # Field is required but missing
+                        raise ValueError(
+                            f"Missing required field: {field_name}"
+                        )
+                    continue
+
+                # Handle None values and fields that need no conversion
+                if field_value is None or convert is None:
+                    init_kwargs[field_name] = field_value
+                    continue
+
+                # Convert the value based on its type
+                converted_value = convert(field_value)
+
+                # For basic types, if conversion returned the original value
+                # unchanged, it means the conversion failed
+                if (
+                    strict_type is not None
+                    and converted_value is field_value
+                    and type(field_value) is not strict_type
+                    and not isinstance(field_value, strict_type)
                 ):
-                    # Field is required but missing
-                    raise ValueError(f"Missing required field: {field_name}")
-                continue
-
-            # Get the field type from type hints
-            field_type = type_hints.get(field_name, field.type)
-
-            # Handle None values
-            if field_value is None:
-                init_kwargs[field_name] = None
-                continue
-
-            # Convert the value based on its type
-            converted_value = Converter._convert_value(field_value, field_type)
-
-            # For basic types, if conversion returned the original value unchanged,
-            # it means the conversion failed
-            if (
-                field_type in (int, float, bool)
-                and converted_value is field_value
-            ):
-                if not isinstance(field_value, field_type):
                     raise TypeError(
-                        f"Field '{field_name}' expects {field_type.__name__} "
+                        f"Field '{field_name}' expects {strict_type.__name__} "
                         f"but cannot convert value {field_value!r} of type {type(field_value).__name__}"
                     )
 
-            init_kwargs[field_name] = converted_value
+                init_kwargs[field_name] = converted_value
+
+            return cls(**init_kwargs)
 
-        return cls(**init_kwargs)
+        cls.__dataclassy_from_dict__ = loader
+        return loader
 
     @staticmethod
-    def _convert_value(value: Any, target_type: Type) -> Any:
+    def to_dict(obj: Any) -> Dict[str, Any]:
         """
-        Convert a single value to the target type.
+        Convert a dataclass instance to a dictionary.
+
+        Produces the same result as dataclasses.asdict(), but uses field
+        names cached per class and returns immutable scalars without the
+        deepcopy round-trip.
+
+        Args:
+            obj: The dataclass instance to convert
+
+        Returns:
+            Dictionary of field names to (recursively converted) values
+
+        Raises:
+            TypeError: If obj is not a dataclass instance
+        """
+        if not hasattr(type(obj), "__dataclass_fields__"):
+            raise TypeError("to_dict() should be called on dataclass instances")
+        return _to_builtin(obj)
+
+    @staticmethod
+    def _field_names(cls: Type) -> Tuple[str, ...]:
+        """
+        Get the field names of a dataclass, cached on the class.
+
+        Args:
+            cls: The dataclass type
+
+        Returns:
+            Tuple of field names in definition order
+        """
+        names = cls.__dict__.get("__dataclassy_field_names__")
+        if names is None:
+            names = tuple(sys.intern(field.name) for field in fields(cls))
+            cls.__dataclassy_field_names__ = names
+        return names
+
+    @staticmethod
+    def _field_plan(
+        cls: Type,
+    ) -> Tuple[Tuple[str, Callable, Optional[type], Any, Any], ...]:
+        """
+        Get the per-class field plan used by from_dict.
+
+        The plan is resolved once per class and stored on it, so repeated
+        conversions skip fields(), type hint resolution and type dispatch.
+
+        Args:
+            cls: The dataclass type
+
+        Returns:
+            Tuple of (name, converter, strict type, default, default_factory)
+            for each field. The strict type is set for int/float/bool fields,
+            whose values must convert or be rejected.
+        """
+        plan = cls.__dict__.get("__dataclassy_fields__")
+        if plan is None:
+            type_hints = cached_type_hints(cls)
+            plan = []
+            for field in fields(cls):
+                field_type = type_hints.get(field.name, field.type)
+                strict_type = (
+                    field_type if field_type in (int, float, bool) else None
+                )
+                plan.append(
+                    (
+                        # Interned names let dict lookups match by identity
+                        sys.intern(field.name),
+                        Converter._build_converter(field_type),
+                        strict_type,
+                        field.default,
+                        field.default_factory,
+                    )
+                )
+            plan = tuple(plan)
+            cls.__dataclassy_fields__ = plan
+        return plan
+
+    @staticmethod
+    def _build_converter(target_type: Type) -> Callable[[Any], Any]:
+        """
+        Get the converter function for a target type.
+
+        Converters are cached per type and shared between every field (in
+        every class) annotated with that type.
 
         Args:
-            value: The value to convert
             target_type: The type to convert to
 
         Returns:
-            The converted value
+            A converter function taking the value to convert
         """
-        # Handle None
-        if value is None:
-            return None
+        try:
+            return _cached_converter(target_type, repr(target_type))
+        except TypeError:
+            # Unhashable annotations (e.g. Annotated metadata) skip the cache
+            return Converter._compile_converter(target_type)
 
+    @staticmethod
+    def _compile_converter(target_type: Type) -> Callable[[Any], Any]:
+        """
+        Build a function converting a single value to the target type.
+
+        All type inspection happens here, once per type, so the returned
+        function only does the conversion work itself. Values that cannot
+        be converted are returned unchanged and None always stays None.
+
+        Args:
+            target_type: The type to convert to
+
+        Returns:
+            A converter function taking the value to convert
+        """
         # Get origin for generic types
         origin = get_origin(target_type)
 
@@ -130,87 +279,223 @@ class Converter:
 
             # If this is Optional[T] (Union[T, None])
             if len(non_none_args) == 1:
-                return Converter._convert_value(value, non_none_args[0])
-            else:
+                return Converter._build_converter(non_none_args[0])
+
+            union_converters = tuple(
+                Converter._build_converter(arg_type)
+                for arg_type in non_none_args
+            )
+
+            def convert_union(value: Any) -> Any:
+                if value is None:
+                    return None
                 # Try each type in the union
-                for arg_type in non_none_args:
+                for convert in union_converters:
                     try:
-                        return Converter._convert_value(value, arg_type)
+                        return convert(value)
                     except (ValueError, TypeError):
                         continue
                 # If no conversion worked, return as-is
                 return value
 
+            return convert_union
+
         # Handle List[T]
         elif origin is list:
-            if not isinstance(value, list):
-                return value
-
             args = get_args(target_type)
-            if args:
-                elem_type = args[0]
-                return [
-                    Converter._convert_value(item, elem_type) for item in value
-                ]
-            return value
+            if not args:
+                return _identity
+
+            convert_item = Converter._build_converter(args[0])
+
+            def convert_list(value: Any) -> Any:
+                if not isinstance(value, list):
+                    return value
+                return [convert_item(item) for item in value]
+
+            return convert_list
 
         # Handle Dict[K, V]
         elif origin is dict:
-            if not isinstance(value, dict):
-                return value
-
             args = get_args(target_type)
-            if len(args) >= 2:
-                key_type, val_type = args[0], args[1]
+            if len(args) < 2:
+                return _identity
+
+            convert_key = Converter._build_converter(args[0])
+            convert_val = Converter._build_converter(args[1])
+
+            def convert_dict(value: Any) -> Any:
+                if not isinstance(value, dict):
+                    return value
                 return {
-                    Converter._convert_value(
-                        k, key_type
-                    ): Converter._convert_value(v, val_type)
-                    for k, v in value.items()
+                    convert_key(k): convert_val(v) for k, v in value.items()
                 }
-            return value
+
+            return convert_dict
 
         # Handle Enum types
         elif isinstance(target_type, type) and issubclass(target_type, Enum):
-            if isinstance(value, target_type):
-                return value
-            try:
-                converter = enum_converter(target_type)
-                return converter(value)
-            except ValueError:
-                return value
+            to_member = _enum_converter(target_type)
+
+            def convert_enum(value: Any) -> Any:
+                if value is None or isinstance(value, target_type):
+                    return value
+                try:
+                    return to_member(value)
+                except ValueError:
+                    return value
+
+            return convert_enum
 
-        # Handle nested dataclasses
+        # Handle nested dataclasses - they resolve their own field plan
         elif is_dataclass(target_type):
-            if isinstance(value, dict):
-                return Converter.from_dict(target_type, value)
-            return value
+
+            def convert_dataclass(value: Any) -> Any:
+                if isinstance(value, dict):
+                    return Converter.from_dict(target_type, value)
+                return value
+
+            return convert_dataclass
 
         # Handle basic type conversion
         elif isinstance(target_type, type):
+            converter = _BASIC_CONVERTERS.get(target_type)
+            if converter is not None:
+                return converter
+
+        # Return value as-is if no conversion applies
+        return _identity
+
+
+@lru_cache(maxsize=1024)
+def _cached_converter(
+    target_type: Type, type_repr: str
+) -> Callable[[Any], Any]:
+    """
+    Cache wrapper around Converter._compile_converter.
+
+    type_repr is part of the key because Union types compare equal
+    regardless of argument order, but the order decides conversion.
+    """
+    return Converter._compile_converter(target_type)
+
+
+# Immutable types that asdict() would deepcopy to the very same object
+_ATOMIC_TYPES = frozenset(
+    {type(None), bool, int, float, complex, str, bytes, range}
+)
+
+
+def _to_builtin(value: Any) -> Any:
+    """Recursively convert a value the way dataclasses.asdict() does."""
+    value_type = type(value)
+
+    if value_type in _ATOMIC_TYPES:
+        return value
+
+    if hasattr(value_type, "__dataclass_fields__"):
+        return {
+            name: _to_builtin(getattr(value, name))
+            for name in Converter._field_names(value_type)
+        }
+
+    if isinstance(value, tuple) and hasattr(value, "_fields"):
+        # Named tuples are rebuilt from positional arguments
+        return value_type(*[_to_builtin(item) for item in value])
+
+    if isinstance(value, (list, tuple)):
+        return value_type(_to_builtin(item) for item in value)
+
+    if isinstance(value, dict):
+        items = ((_to_builtin(k), _to_builtin(v)) for k, v in value.items())
+        if hasattr(value_type, "default_factory"):
+            # defaultdict takes its factory as the first argument
+            return value_type(value.default_factory, items)
+        return value_type(items)
+
+    return copy.deepcopy(value)
+
+
+def _identity(value: Any) -> Any:
+    """Return the value unchanged."""
+    return value
+
+
+# Lowercased strings accepted for bool fields
+_TRUE_STRINGS = frozenset({"true", "1", "yes", "on"})
+_FALSE_STRINGS = frozenset({"false", "0", "no", "off"})
+
+
+def _convert_bool(value: Any) -> Any:
+    """Convert a value to bool, returning it unchanged if that fails."""
+    if value is None or type(value) is bool:
+        return value
+
+    # Special handling for bool conversion from strings
+    if isinstance(value, str):
+        lower_val = value.lower()
+        if lower_val in _TRUE_STRINGS:
+            return True
+        elif lower_val in _FALSE_STRINGS:
+            return False
+        # For any other string, leave it to the caller to reject
+        return value
+
+    return bool(value)
+
+
+def _convert_str(value: Any) -> Any:
+    """Convert a value to str, returning it unchanged if that fails."""
+    # Exact type match is the common case for parsed data
+    if type(value) is str or value is None or isinstance(value, str):
+        return value
+    try:
+        return str(value)
+    except (ValueError, TypeError):
+        # Don't raise here, let the caller decide what to do
+        return value
+
+
+def _number_converter(
+    target_type: type, casts: Dict[type, Callable[[Any], Any]]
+) -> Callable[[Any], Any]:
+    """
+    Build a converter to a numeric type that dispatches on the value's type.
+
+    Args:
+        target_type: The numeric type to convert to
+        casts: Conversion function for each common exact input type
+
+    Returns:
+        A converter function taking the value to convert
+    """
+
+    def convert_number(value: Any) -> Any:
+        # One dict lookup covers the common input types
+        cast = casts.get(type(value))
+        if cast is None:
             # If value is already the correct type, return it
-            if isinstance(value, target_type):
+            if value is None or isinstance(value, target_type):
                 return value
+            cast = target_type
+        try:
+            return cast(value)
+        except (ValueError, TypeError):
+            # Don't raise here, let the caller decide what to do
+            return value
 
-            # Try to convert basic types
-            try:
-                if target_type is bool:
-                    # Special handling for bool conversion from strings
-                    if isinstance(value, str):
-                        lower_val = value.lower()
-                        if lower_val in ("true", "1", "yes", "on"):
-                            return True
-                        elif lower_val in ("false", "0", "no", "off"):
-                            return False
-                        # For any other string, raise ValueError
-                        raise ValueError(f"Cannot convert '{value}' to bool")
-                    else:
-                        return bool(value)
-                elif target_type in (int, float, str):
-                    return target_type(value)
-            except (ValueError, TypeError):
-                # Don't raise here, let the caller decide what to do
-                pass
-
-        # Return value as-is if no conversion applied
-        return value
+    return convert_number
+
+
+# Converters for basic types, by target type. bool is an int subclass, so
+# bools are already valid ints, but become 0.0/1.0 for float fields.
+_BASIC_CONVERTERS = {
+    bool: _convert_bool,
+    str: _convert_str,
+    int: _number_converter(
+        int, {int: _identity, bool: _identity, str: int, float: int}
+    ),
+    float: _number_converter(
+        float, {float: _identity, int: float, bool: float, str: float}
+    ),
+}
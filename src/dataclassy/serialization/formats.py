@@ -1,13 +1,476 @@
 """File format handlers for dataclassy serialization."""
 
 import json
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Union
-
-from dataclasses import asdict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from .converter import Converter
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Buffer size for streaming stdlib json output to disk
+_JSON_WRITE_BUFFER = 64 * 1024
+
+
+def _orjson_options(indent: Any, sort_keys: bool) -> Any:
+    """
+    Map json.dump style options onto orjson flags.
+
+    Returns None when orjson is unavailable or cannot honour the requested
+    indentation (orjson only supports compact or 2-space output).
+    """
+    if orjson is None or indent not in (None, 2):
+        return None
+
+    option = 0
+    if indent == 2:
+        option |= orjson.OPT_INDENT_2
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    return option
+
+
+# Payloads below this size skip the io stack and go straight to os.write()
+_SMALL_WRITE_LIMIT = 64 * 1024
+
+# Flags for truncating writes; O_BINARY only exists (and matters) on Windows
+_WRITE_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+)
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    """
+    Write an encoded payload to a file, replacing its contents.
+
+    Small payloads are written with raw os.open()/os.write() calls, which
+    avoids setting up the buffered file object layers for a single write.
+    Files are created with the same permissions as open() would use.
+    """
+    if len(data) >= _SMALL_WRITE_LIMIT:
+        with open(path, "wb") as f:
+            f.write(data)
+        return
+
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(data)
+        # os.write() may write less than requested, so loop until done
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def _read_bytes(path: str) -> bytes:
+    """
+    Read a whole file as bytes.
+
+    Uses raw os.open()/os.read() calls sized from fstat(), so reading a
+    config file doesn't set up a buffered file object.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        chunks = []
+        # Read until EOF; the file may have grown since fstat()
+        while True:
+            chunk = os.read(fd, max(size, _JSON_WRITE_BUFFER))
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+
+# Optional format libraries are imported on first use of their format, so
+# JSON-only programs never pay for them. The import statement is re-run on
+# each call (a sys.modules lookup once loaded) rather than cached here, so
+# sys.modules stays the single source of truth.
+
+
+def _import_yaml() -> Any:
+    """Import PyYAML or raise an ImportError with install instructions."""
+    try:
+        import yaml
+    except ImportError:
+        raise ImportError(
+            "PyYAML is required for YAML support. "
+            "Install with: pip install dataclassy[yaml]"
+        )
+    return yaml
+
+
+def _import_tomllib() -> Any:
+    """Import tomllib (or tomli on Python < 3.11)."""
+    try:
+        import tomllib
+    except ImportError:
+        try:
+            import tomli as tomllib
+        except ImportError:
+            raise ImportError(
+                "tomli is required for TOML support on Python < 3.11. "
+                "Install with: pip install dataclassy[toml]"
+            )
+    return tomllib
+
+
+def _import_tomli_w() -> Any:
+    """Import tomli-w or raise an ImportError with install instructions."""
+    try:
+        import tomli_w
+    except ImportError:
+        raise ImportError(
+            "tomli-w is required for TOML writing. "
+            "Install with: pip install dataclassy[toml]"
+        )
+    return tomli_w
+
+
+# orjson is only a faster backend: anything it would handle differently
+# from the stdlib json module (NaN/Infinity, integers beyond 64 bits, types
+# json can't serialize) goes through the json module instead, so results
+# never depend on whether orjson is installed.
+
+# orjson reads integer literals past 64 bits as floats, so input with long
+# integer literals is left to the json module. Instead of a regex, which
+# backtracks over every digit run of number-heavy files, bytes are mapped
+# to "0" for digits, "." for the characters that continue a float (".",
+# "e", "E") and " " for everything else; a run of 19 zeros after a space
+# is then the start of a long integer (or harmlessly, of a long string).
+_NUMBER_SHAPES = bytes(
+    b"0"[0] if byte in b"0123456789" else b"."[0] if byte in b".eE" else b" "[0]
+    for byte in range(256)
+)
+_LONG_DIGITS = b"0" * 19
+
+
+def _has_long_int(raw: bytes) -> bool:
+    """Check for an integer literal orjson might read as a float."""
+    shapes = raw.translate(_NUMBER_SHAPES)
+    return b" " + _LONG_DIGITS in shapes or shapes.startswith(_LONG_DIGITS)
+
+
+# Scalar types both libraries serialize identically
+_JSON_SCALARS = frozenset({str, bool, type(None)})
+
+
+def _orjson_compatible(value: Any) -> bool:
+    """Check that orjson would serialize a value exactly as json does."""
+    value_type = type(value)
+    if value_type in _JSON_SCALARS:
+        return True
+    if value_type is int:
+        return -(2**63) <= value < 2**64
+    if value_type is float:
+        # orjson writes NaN and Infinity as null
+        return math.isfinite(value)
+    if value_type is dict:
+        return all(
+            type(key) is str and _orjson_compatible(item)
+            for key, item in value.items()
+        )
+    if value_type is list or value_type is tuple:
+        return all(_orjson_compatible(item) for item in value)
+    # Subclasses and other types (datetime, UUID, Enum, ...) are left to
+    # json, which serializes or rejects them
+    return False
+
+
+def _orjson_dumps(data: Any, indent: Any, sort_keys: bool) -> Optional[bytes]:
+    """
+    Serialize data with orjson when that matches the json module's output.
+
+    Returns:
+        The encoded JSON, or None if the json module must be used
+    """
+    option = _orjson_options(indent, sort_keys)
+    if option is None or not _orjson_compatible(data):
+        return None
+    try:
+        return orjson.dumps(data, option=option)
+    except TypeError:
+        # orjson.JSONEncodeError, e.g. for too deeply nested data
+        return None
+
+
+def _load_json(path: str) -> Any:
+    """Load raw data from a JSON file."""
+    # Both parsers accept bytes, so skip decoding into an intermediate str
+    raw = _read_bytes(path)
+    if orjson is not None and not _has_long_int(raw):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity literals and other input only json accepts; json
+            # also raises the error for input that is really invalid
+            pass
+    return json.loads(raw)
+
+
+def _dumps_json(data: Dict[str, Any], **kwargs) -> str:
+    """Serialize raw data to a JSON string."""
+    indent = kwargs.get("indent", 2)
+    sort_keys = kwargs.get("sort_keys", False)
+
+    encoded = _orjson_dumps(data, indent, sort_keys)
+    if encoded is not None:
+        return encoded.decode("utf-8")
+    return json.dumps(data, indent=indent, sort_keys=sort_keys)
+
+
+def _dump_json(data: Dict[str, Any], path: str, **kwargs) -> None:
+    """Write raw data to a JSON file."""
+    indent = kwargs.get("indent", 2)
+    sort_keys = kwargs.get("sort_keys", False)
+
+    encoded = _orjson_dumps(data, indent, sort_keys)
+    if encoded is not None:
+        _write_bytes(path, encoded)
+    else:
+        # Stream the encoder output into a buffer big enough for a typical
+        # config file, so the dump ends up as a single write
+        with open(
+            path, "w", encoding="utf-8", buffering=_JSON_WRITE_BUFFER
+        ) as f:
+            json.dump(data, f, indent=indent, sort_keys=sort_keys)
+
+
+def _load_yaml(path: str) -> Any:
+    """Load raw data from a YAML file."""
+    yaml = _import_yaml()
+
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=loader)
+
+
+def _dumps_yaml(data: Dict[str, Any], **kwargs) -> str:
+    """Serialize raw data to a YAML string."""
+    yaml = _import_yaml()
+
+    default_flow_style = kwargs.get("default_flow_style", False)
+    sort_keys = kwargs.get("sort_keys", False)
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+    return yaml.dump(
+        data,
+        Dumper=dumper,
+        default_flow_style=default_flow_style,
+        sort_keys=sort_keys,
+    )
+
+
+def _dump_yaml(data: Dict[str, Any], path: str, **kwargs) -> None:
+    """Write raw data to a YAML file."""
+    _write_bytes(path, _dumps_yaml(data, **kwargs).encode("utf-8"))
+
+
+def _load_toml(path: str) -> Any:
+    """Load raw data from a TOML file."""
+    tomllib = _import_tomllib()
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+def _dumps_toml(data: Dict[str, Any], **kwargs) -> str:
+    """Serialize raw data to a TOML string."""
+    return _import_tomli_w().dumps(data)
+
+
+def _dump_toml(data: Dict[str, Any], path: str, **kwargs) -> None:
+    """Write raw data to a TOML file."""
+    _write_bytes(path, _dumps_toml(data, **kwargs).encode("utf-8"))
+
+
+def _parse_simple_ini(text: str) -> Optional[Tuple[dict, dict]]:
+    """
+    Parse the plain `key = value` subset of INI used by dataclassy.
+
+    Mirrors configparser's defaults (comment prefixes, `=`/`:` delimiters,
+    lowercased keys) without its regex and interpolation machinery.
+
+    Args:
+        text: The INI file contents
+
+    Returns:
+        Tuple of (defaults, sections), or None if the text uses anything
+        outside the subset (continuation lines, interpolation, duplicates,
+        malformed lines) and needs configparser
+    """
+    defaults = {}
+    sections = {}
+    current = None
+
+    for line in text.splitlines():
+        stripped = line.strip()
+
+        # Skip blank lines and full-line comments
+        if not stripped or stripped[0] in "#;":
+            continue
+
+        # Indented lines continue a multi-line value
+        if line[0].isspace():
+            return None
+
+        if stripped[0] == "[" and stripped[-1] == "]":
+            name = stripped[1:-1]
+            if name == "DEFAULT":
+                current = defaults
+            elif name in sections:
+                return None
+            else:
+                current = sections[name] = {}
+            continue
+
+        # Key/value lines must follow a section header
+        if current is None:
+            return None
+
+        # Split on the first delimiter, whichever comes first
+        positions = [
+            i for i in (stripped.find("="), stripped.find(":")) if i >= 0
+        ]
+        if not positions:
+            return None
+        index = min(positions)
+
+        key = stripped[:index].rstrip().lower()
+        value = stripped[index + 1 :].lstrip()
+        if not key or key in current or "%" in value:
+            return None
+        current[key] = value
+
+    return defaults, sections
+
+
+def _load_ini(path: str) -> Any:
+    """Load raw data from an INI file."""
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+
+    parsed = _parse_simple_ini(text)
+    if parsed is not None:
+        defaults, sections = parsed
+    else:
+        import configparser
+
+        parser = configparser.ConfigParser()
+        parser.read_string(text, source=path)
+        defaults = dict(parser.defaults())
+        sections = {
+            section: dict(parser.items(section))
+            for section in parser.sections()
+        }
+
+    # Convert INI to dict format - DEFAULT values become top-level keys
+    data = dict(defaults)
+
+    # Sections become nested dicts and, like configparser, inherit DEFAULT
+    for section, values in sections.items():
+        data[section] = {**defaults, **values}
+
+    return data
+
+
+def _format_ini_section(name: str, values: Dict[str, Any]) -> str:
+    """Format one INI section the way configparser writes it."""
+    lines = [f"[{name}]"]
+    for key, value in values.items():
+        value = str(value)
+        if "%" in value:
+            if name == "DEFAULT":
+                # DEFAULT values are loaded raw, so they are written as is;
+                # like configparser, reject % that can't be interpolated
+                import configparser
+
+                configparser.BasicInterpolation().before_set(
+                    None, name, key, value
+                )
+            else:
+                # Section values are interpolated when loaded, so escape %
+                value = value.replace("%", "%%")
+        # Indent continuation lines of multi-line values
+        value = value.replace("\n", "\n\t")
+        lines.append(f"{key.lower()} = {value}")
+    return "\n".join(lines) + "\n\n"
+
+
+def _dumps_ini(data: Dict[str, Any], **kwargs) -> str:
+    """Serialize raw data to an INI string."""
+    # Dict fields become sections, everything else goes to DEFAULT
+    defaults = {k: v for k, v in data.items() if not isinstance(v, dict)}
+    sections = {k: v for k, v in data.items() if isinstance(v, dict)}
+
+    parts = []
+    if defaults:
+        parts.append(_format_ini_section("DEFAULT", defaults))
+    for section, values in sections.items():
+        parts.append(_format_ini_section(section, values))
+
+    return "".join(parts)
+
+
+def _dump_ini(data: Dict[str, Any], path: str, **kwargs) -> None:
+    """Write raw data to an INI file."""
+    _write_bytes(path, _dumps_ini(data, **kwargs).encode("utf-8"))
+
+
+# Maps a lowercase file extension to its (loader, dumper) pair
+_HANDLERS: Dict[str, Tuple[Callable[..., Any], Callable[..., None]]] = {
+    ".json": (_load_json, _dump_json),
+    ".yaml": (_load_yaml, _dump_yaml),
+    ".yml": (_load_yaml, _dump_yaml),
+    ".toml": (_load_toml, _dump_toml),
+    ".ini": (_load_ini, _dump_ini),
+}
+
+
+# Maps a lowercase file extension to the function rendering raw data as the
+# text its _HANDLERS dumper writes
+_STRING_DUMPERS: Dict[str, Callable[..., str]] = {
+    ".json": _dumps_json,
+    ".yaml": _dumps_yaml,
+    ".yml": _dumps_yaml,
+    ".toml": _dumps_toml,
+    ".ini": _dumps_ini,
+}
+
+
+def _get_handlers(ext: str) -> Tuple[Callable[..., Any], Callable[..., None]]:
+    """
+    Look up the loader/dumper pair for a file extension.
+
+    Raises:
+        ValueError: If the file format is not supported
+    """
+    handlers = _HANDLERS.get(ext)
+    if handlers is None:
+        raise ValueError(
+            f"Unsupported file format: {ext}. "
+            f"Supported formats: .json, .yaml, .yml, .toml, .ini"
+        )
+    return handlers
+
 
 class FormatHandler:
     """Handles loading and saving dataclasses to various file formats."""
@@ -32,78 +495,15 @@ class FormatHandler:
             ValueError: If the file format is not supported
             ImportError: If required library for format is not installed
         """
-        path = Path(path)
+        # Plain string operations are enough here, no Path objects needed
+        path = os.fspath(path)
 
-        if not path.exists():
+        if not os.path.exists(path):
             raise FileNotFoundError(f"File not found: {path}")
 
         # Determine format from extension
-        ext = path.suffix.lower()
-
-        if ext == ".json":
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-        elif ext in [".yaml", ".yml"]:
-            try:
-                import yaml
-            except ImportError:
-                raise ImportError(
-                    "PyYAML is required for YAML support. "
-                    "Install with: pip install dataclassy[yaml]"
-                )
-            with open(path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-
-        elif ext == ".toml":
-            try:
-                import tomllib
-            except ImportError:
-                try:
-                    import tomli as tomllib
-                except ImportError:
-                    raise ImportError(
-                        "tomli is required for TOML support on Python < 3.11. "
-                        "Install with: pip install dataclassy[toml]"
-                    )
-            with open(path, "rb") as f:
-                data = tomllib.load(f)
-
-        elif ext == ".ini":
-            import configparser
-
-            parser = configparser.ConfigParser()
-            parser.read(path)
-
-            # Convert INI to dict format
-            data = {}
-
-            # Check if there are any sections
-            sections = parser.sections()
-
-            if sections:
-                # Has sections - combine DEFAULT and section data
-                data = {}
-
-                # Start with defaults if any
-                if parser.defaults():
-                    data.update(dict(parser.defaults()))
-
-                # Add section data
-                for section in sections:
-                    data[section] = dict(parser.items(section))
-            else:
-                # No sections, only DEFAULT section
-                if parser.defaults():
-                    data = dict(parser.defaults())
-                else:
-                    data = {}
-
-        else:
-            raise ValueError(
-                f"Unsupported file format: {ext}. "
-                f"Supported formats: .json, .yaml, .yml, .toml, .ini"
-            )
+        loader, _ = _get_handlers(os.path.splitext(path)[1].lower())
+        data = loader(path)
 
         return Converter.from_dict(cls, data)
 
@@ -127,92 +527,82 @@ class FormatHandler:
             ValueError: If the file format is not supported
             ImportError: If required library for format is not installed
         """
-        path = Path(path)
+        path = os.fspath(path)
+
+        # Determine format from extension
+        _, dumper = _get_handlers(os.path.splitext(path)[1].lower())
 
         # Ensure parent directory exists
-        path.parent.mkdir(parents=True, exist_ok=True)
+        parent = os.path.dirname(path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
 
         # Convert to dict
-        data = asdict(obj)
+        data = Converter.to_dict(obj)
 
-        # Determine format from extension
-        ext = path.suffix.lower()
-
-        if ext == ".json":
-            indent = kwargs.get("indent", 2)
-            sort_keys = kwargs.get("sort_keys", False)
-
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=indent, sort_keys=sort_keys)
-
-        elif ext in [".yaml", ".yml"]:
-            try:
-                import yaml
-            except ImportError:
-                raise ImportError(
-                    "PyYAML is required for YAML support. "
-                    "Install with: pip install dataclassy[yaml]"
-                )
+        dumper(data, path, **kwargs)
 
-            default_flow_style = kwargs.get("default_flow_style", False)
-            sort_keys = kwargs.get("sort_keys", False)
+    @staticmethod
+    def from_paths(
+        cls: type,
+        paths: Iterable[Union[str, Path]],
+        workers: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Load dataclass instances from several files concurrently.
 
-            with open(path, "w", encoding="utf-8") as f:
-                yaml.dump(
-                    data,
-                    f,
-                    default_flow_style=default_flow_style,
-                    sort_keys=sort_keys,
-                )
+        Files are read on a thread pool, which overlaps the file I/O of
+        many small config files.
 
-        elif ext == ".toml":
-            try:
-                import tomllib
-                import tomli_w
-            except ImportError:
-                try:
-                    import tomli as tomllib
-                    import tomli_w
-                except ImportError:
-                    raise ImportError(
-                        "tomli-w is required for TOML writing. "
-                        "Install with: pip install dataclassy[toml]"
-                    )
-
-            with open(path, "wb") as f:
-                tomli_w.dump(data, f)
-
-        elif ext == ".ini":
-            import configparser
-
-            parser = configparser.ConfigParser()
-
-            # Check if there are any dict values that should become sections
-            dict_fields = {k: v for k, v in data.items() if isinstance(v, dict)}
-
-            if dict_fields:
-                # Multi-section INI - dict fields become sections
-                for section, values in dict_fields.items():
-                    parser.add_section(section)
-                    for key, value in values.items():
-                        parser.set(section, key, str(value))
-
-                # Non-dict fields go to DEFAULT section
-                non_dict_fields = {
-                    k: v for k, v in data.items() if not isinstance(v, dict)
-                }
-                for key, value in non_dict_fields.items():
-                    parser.set("DEFAULT", key, str(value))
-            else:
-                # Single section INI - all fields to DEFAULT
-                for key, value in data.items():
-                    parser.set("DEFAULT", key, str(value))
+        Args:
+            cls: The dataclass type to load into
+            paths: Paths to the files
+            workers: Maximum number of threads (default: ThreadPoolExecutor's)
 
-            with open(path, "w", encoding="utf-8") as f:
-                parser.write(f)
+        Returns:
+            List of instances, in the same order as paths
+
+        Raises:
+            FileNotFoundError: If one of the files doesn't exist
+            ValueError: If a file format is not supported
+            ImportError: If required library for a format is not installed
+        """
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(lambda p: FormatHandler.from_path(cls, p), paths)
+            )
 
-        else:
-            raise ValueError(
-                f"Unsupported file format: {ext}. "
-                f"Supported formats: .json, .yaml, .yml, .toml, .ini"
+    @staticmethod
+    def to_paths(
+        objs: Iterable[Any],
+        paths: Iterable[Union[str, Path]],
+        workers: Optional[int] = None,
+        **kwargs,
+    ) -> None:
+        """
+        Save several dataclass instances to files concurrently.
+
+        Args:
+            objs: The dataclass instances to save
+            paths: Paths to save to, one per instance
+            workers: Maximum number of threads (default: ThreadPoolExecutor's)
+            **kwargs: Additional arguments passed to the serializer
+
+        Raises:
+            ValueError: If objs and paths differ in length, or a file
+                format is not supported
+            ImportError: If required library for a format is not installed
+        """
+        objs = list(objs)
+        paths = list(paths)
+        if len(objs) != len(paths):
+            raise ValueError(f"Got {len(objs)} objects but {len(paths)} paths")
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Consume the results so worker exceptions are raised here
+            list(
+                executor.map(
+                    lambda item: FormatHandler.to_path(*item, **kwargs),
+                    zip(objs, paths),
+                )
             )
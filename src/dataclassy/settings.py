@@ -1,29 +1,61 @@
 """Settings decorator for configuration management."""
 
+import io
+import json
 import os
-from dataclasses import fields, asdict
+import re
+import sys
+from collections import ChainMap
+from dataclasses import MISSING, fields
 from pathlib import Path
 from typing import (
     Any,
+    Callable,
     Dict,
+    FrozenSet,
     List,
+    Mapping,
     Optional,
+    TextIO,
     Type,
     TypeVar,
     Union,
     Tuple,
-    get_type_hints,
     get_origin,
     get_args,
 )
-from functools import wraps
+from functools import lru_cache, wraps
+from itertools import islice
 
 from .core import dataclassy
-from .serialization.formats import FormatHandler
-from .utils import merge_configs
+from .serialization.converter import Converter
+from .serialization.formats import (
+    _STRING_DUMPERS,
+    _dump_json,
+    _dumps_ini,
+    _dumps_json,
+    _dumps_yaml,
+    _get_handlers,
+    _load_ini,
+    _load_json,
+    _load_toml,
+    _load_yaml,
+    _write_bytes,
+)
+from .utils import cached_type_hints
 
 T = TypeVar("T")
 
+# A numpydoc-style `field_name : type` line in a class docstring
+_FIELD_DOC_RE = re.compile(r"^[^\S\n]*(.*?) : (?=.*\S).*$", re.MULTILINE)
+
+# Leading and trailing whitespace on each line of a docstring
+_INDENT_STRIP_RE = re.compile(r"^[^\S\n]+|[^\S\n]+$", re.MULTILINE)
+
+# Most field comments attached when saving YAML with ruamel.yaml, whose
+# per-key comment handling gets slow on very large configs
+MAX_COMMENT_FIELDS = 100
+
 
 def settings(
     cls: Optional[Type[T]] = None,
@@ -89,6 +121,10 @@ def settings(
             "case_sensitive": case_sensitive,
         }
 
+        # Map environment variable names to field names once per class
+        if env_prefix:
+            cls._env_index = (env_prefix, _build_env_index(cls, env_prefix))
+
         # Add load_config method
         @classmethod
         def load_config(
@@ -108,8 +144,8 @@ def settings(
             Returns:
                 Instance of the settings class with loaded configuration
             """
-            # Start with empty config
-            config = {}
+            # Collect each source's data, lowest precedence first
+            sources = []
 
             # Get paths to load
             paths = list(cls._settings_config["config_paths"])
@@ -121,14 +157,11 @@ def settings(
             # Search for config files if config_name is provided
             if cls._settings_config["config_name"] and not paths:
                 for search_dir in cls._settings_config["search_dirs"]:
-                    search_dir = Path(search_dir)
-                    for ext in [".json", ".yaml", ".yml", ".toml", ".ini"]:
-                        path = (
-                            search_dir
-                            / f"{cls._settings_config['config_name']}{ext}"
+                    paths.extend(
+                        _find_config_files(
+                            search_dir, cls._settings_config["config_name"]
                         )
-                        if path.exists():
-                            paths.append(path)
+                    )
 
             # Load and merge config files
             for path in paths:
@@ -139,51 +172,34 @@ def settings(
                     ext = path_obj.suffix.lower()
 
                     if ext == ".json":
-                        import json
-
-                        with open(path_obj, "r") as f:
-                            loaded_dict = json.load(f)
+                        loaded_dict = _read_cached_config(
+                            path_obj, _parse_json_file
+                        )
                     elif ext in [".yaml", ".yml"]:
-                        import yaml
-
-                        with open(path_obj, "r") as f:
-                            loaded_dict = yaml.safe_load(f)
+                        loaded_dict = _load_yaml(path_obj)
                     elif ext == ".toml":
-                        try:
-                            import tomllib
-                        except ImportError:
-                            import tomli as tomllib
-                        with open(path_obj, "rb") as f:
-                            loaded_dict = tomllib.load(f)
+                        loaded_dict = _load_toml(path_obj)
                     elif ext == ".ini":
-                        import configparser
-
-                        parser = configparser.ConfigParser()
-                        parser.read(path_obj)
-                        loaded_dict = {}
-                        sections = parser.sections()
-                        if sections:
-                            if parser.defaults():
-                                loaded_dict.update(dict(parser.defaults()))
-                            for section in sections:
-                                loaded_dict[section] = dict(
-                                    parser.items(section)
-                                )
-                        else:
-                            if parser.defaults():
-                                loaded_dict = dict(parser.defaults())
+                        loaded_dict = _read_cached_config(
+                            path_obj, _parse_ini_file
+                        )
                     else:
                         # Unknown format, skip
                         continue
 
-                    config = merge_configs(
-                        config,
-                        loaded_dict,
-                        cls._settings_config["merge_strategy"],
-                    )
+                    # Files without a mapping at the top level are ignored
+                    if isinstance(loaded_dict, dict):
+                        sources.append(loaded_dict)
+                except (OSError, ImportError):
+                    # Skip missing or unreadable files, and formats whose
+                    # optional library isn't installed
+                    continue
                 except Exception:
-                    # Ignore files that can't be loaded
-                    pass
+                    # Empty files have nothing to load; parse errors in
+                    # files with content are raised, not silently ignored
+                    if _is_empty_file(path_obj):
+                        continue
+                    raise
 
             # Load from environment variables
             if load_env and cls._settings_config["env_prefix"]:
@@ -192,16 +208,18 @@ def settings(
                     cls._settings_config["env_prefix"],
                     cls._settings_config["env_nested_delimiter"],
                     cls._settings_config["case_sensitive"],
+                    # Snapshot the environment once for this load
+                    environ=dict(os.environ),
                 )
-                config = merge_configs(
-                    config, env_config, cls._settings_config["merge_strategy"]
-                )
+                sources.append(env_config)
 
             # Apply overrides
             if overrides:
-                config = merge_configs(
-                    config, overrides, cls._settings_config["merge_strategy"]
-                )
+                sources.append(overrides)
+
+            config = _merge_sources(
+                sources, cls._settings_config["merge_strategy"]
+            )
 
             # Create instance
             return cls.from_dict(config)
@@ -210,9 +228,9 @@ def settings(
         def reload(self) -> None:
             """Reload configuration from sources."""
             new_config = self.__class__.load_config()
-            # Update instance attributes
-            for field in fields(self):
-                setattr(self, field.name, getattr(new_config, field.name))
+            # Update instance attributes, using the per-class field names
+            for name in Converter._field_names(self.__class__):
+                setattr(self, name, getattr(new_config, name))
 
         # Add save_config method
         def save_config(
@@ -231,55 +249,63 @@ def settings(
                 include_comments: Whether to include comments from docstrings
                 **kwargs: Additional arguments for the file format
             """
-            # Get data to save
-            if include_defaults:
-                data = asdict(self)
-            else:
-                data = {}
-                from dataclasses import MISSING
-
-                for field in fields(self):
-                    value = getattr(self, field.name)
-
-                    # Check if field has a default value
-                    if field.default is not MISSING:
-                        # Has a simple default value - only save if changed
-                        if value != field.default:
-                            data[field.name] = value
-                    elif field.default_factory is not MISSING:
-                        # Has a default_factory - can't compare easily
-                        # Try to call it and compare
-                        try:
-                            default_val = field.default_factory()
-                            if value != default_val:
-                                data[field.name] = value
-                        except:
-                            # If we can't create default, include the value
-                            data[field.name] = value
-                    else:
-                        # No default - this is a required field, always include
-                        data[field.name] = value
-
-            # Handle saving based on whether we're including all fields or not
-            if include_defaults:
-                # Use FormatHandler with full object
-                if include_comments:
-                    # Save with format-aware comments
-                    _save_with_format_aware_comments(
-                        self.__class__, data, path, include_comments, **kwargs
-                    )
-                else:
-                    FormatHandler.to_path(self, path, **kwargs)
-            else:
-                # We have a reduced data set - save it directly
-                _save_with_format_aware_comments(
-                    self.__class__, data, path, include_comments, **kwargs
-                )
+            # The file is about to change, drop any cached parse of it
+            _parse_json_file.cache_clear()
+            _parse_ini_file.cache_clear()
+
+            # Ensure parent directory exists, as FormatHandler.to_path() does
+            parent = os.path.dirname(os.fspath(path))
+            if parent:
+                os.makedirs(parent, exist_ok=True)
+
+            # The same writer backs save_config_to_stream(), so files and
+            # streams get identical output
+            _save_with_format_aware_comments(
+                self.__class__,
+                _settings_data(self, include_defaults),
+                path,
+                include_comments,
+                **kwargs,
+            )
+
+        # Add save_config_to_stream method
+        def save_config_to_stream(
+            self,
+            stream: TextIO,
+            format: str = "json",
+            include_defaults: bool = True,
+            include_comments: bool = True,
+            **kwargs,
+        ) -> None:
+            """
+            Save configuration to a text stream, such as an io.StringIO.
+
+            Args:
+                stream: Text stream to write to
+                format: Format name or extension ("json", "yaml", "yml",
+                    "toml" or "ini")
+                include_defaults: Whether to include fields with default values
+                include_comments: Whether to include comments from docstrings
+                **kwargs: Additional arguments for the file format
+            """
+            ext = format.lower()
+            if not ext.startswith("."):
+                ext = "." + ext
+
+            _write_with_format_aware_comments(
+                self.__class__,
+                _settings_data(self, include_defaults),
+                stream,
+                ext,
+                include_comments,
+                **kwargs,
+            )
 
         # Add methods to class
         cls.load_config = load_config
         cls.reload = reload
         cls.save_config = save_config
+        cls.save_config_to_stream = save_config_to_stream
 
         # Auto-load if requested
         if auto_load:
@@ -292,7 +318,9 @@ def settings(
                 if not args and not kwargs:
                     # Load config and get its data
                     loaded = cls.load_config()
-                    loaded_data = asdict(loaded)
+                    # to_dict() matches asdict() but shares immutable
+                    # values instead of deep-copying them
+                    loaded_data = Converter.to_dict(loaded)
                     # Initialize with loaded data
                     original_init(self, **loaded_data)
                 else:
@@ -310,8 +338,250 @@ def settings(
         return wrapper(cls)
 
 
+# Config file extensions searched for, in loading order
+_CONFIG_EXTENSIONS = (".json", ".yaml", ".yml", ".toml", ".ini")
+
+
+def _is_empty_file(path: Path) -> bool:
+    """Check whether a file exists but has no content."""
+    try:
+        return path.stat().st_size == 0
+    except OSError:
+        return False
+
+
+def _find_config_files(
+    search_dir: Union[str, Path], config_name: str
+) -> List[Path]:
+    """
+    Find the config files named config_name in a directory.
+
+    Reads the directory once instead of probing each candidate name.
+    Names are matched the way the filesystem resolves them, so on a
+    case-insensitive filesystem "Config.JSON" is found for "config".
+
+    Args:
+        search_dir: Directory to search
+        config_name: Base name of the config files
+
+    Returns:
+        Paths of the files found, in _CONFIG_EXTENSIONS order
+    """
+    candidates = {
+        (config_name + ext).casefold(): config_name + ext
+        for ext in _CONFIG_EXTENSIONS
+    }
+    try:
+        with os.scandir(search_dir) as entries:
+            matches = [
+                (entry.name, candidates[entry.name.casefold()])
+                for entry in entries
+                if entry.name.casefold() in candidates and entry.is_file()
+            ]
+    except OSError:
+        # Missing or unreadable directories have no config files
+        return []
+
+    search_dir = Path(search_dir)
+    found = set()
+    for name, candidate in matches:
+        # A name differing only in case is the candidate file only if the
+        # filesystem is case-insensitive, which exists() tells us
+        if name == candidate or (search_dir / candidate).exists():
+            found.add(candidate)
+
+    return [
+        search_dir / (config_name + ext)
+        for ext in _CONFIG_EXTENSIONS
+        if config_name + ext in found
+    ]
+
+
+def _merge_sources(
+    sources: List[Dict[str, Any]], strategy: str = "deep"
+) -> Dict[str, Any]:
+    """
+    Merge configuration sources, later sources taking precedence.
+
+    Gives the same result as folding merge_configs() over the sources, but
+    resolves flat keys in one ChainMap pass and only merges recursively
+    where a key holds a dict in more than one source.
+
+    Args:
+        sources: Configuration dictionaries, lowest precedence first
+        strategy: 'deep' for recursive merge, 'shallow' for top-level only
+
+    Returns:
+        Merged configuration dictionary
+    """
+    merged = dict(ChainMap(*reversed(sources)))
+    if strategy == "shallow":
+        return merged
+
+    for key, value in merged.items():
+        if not isinstance(value, dict):
+            continue
+
+        # Nested dicts merge back to the latest non-dict value for the key
+        nested = []
+        for source in reversed(sources):
+            if key in source:
+                if not isinstance(source[key], dict):
+                    break
+                nested.append(source[key])
+
+        if len(nested) > 1:
+            nested.reverse()
+            merged[key] = _merge_sources(nested, strategy)
+
+    return merged
+
+
+@lru_cache(maxsize=128)
+def _parse_json_file(path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a JSON config file.
+
+    Cached on the file's modification time and size as well as its path,
+    so an edited file is parsed again while unchanged files are not.
+    """
+    return _load_json(path)
+
+
+@lru_cache(maxsize=128)
+def _parse_ini_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse an INI config file, cached like _parse_json_file()."""
+    return _load_ini(path)
+
+
+def _read_cached_config(
+    path: Union[str, Path], parse: Callable[[str, int, int], Any]
+) -> Any:
+    """
+    Load raw data from a config file through one of the parse caches.
+
+    Args:
+        path: Path to the file
+        parse: The cached parse function for the file's format
+
+    Returns:
+        The parsed data, safe for the caller to modify
+    """
+    path = os.fspath(path)
+    st = os.stat(path)
+    return _copy_config(parse(path, st.st_mtime_ns, st.st_size))
+
+
+def _copy_config(value: Any) -> Any:
+    """Copy the dicts and lists of parsed config data, sharing the scalars."""
+    if isinstance(value, dict):
+        return {key: _copy_config(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_config(item) for item in value]
+    return value
+
+
+def _settings_meta(cls: Type) -> Dict[str, Any]:
+    """
+    Get the introspection results for a settings class.
+
+    Type hints and docstring comments only depend on the class, so they
+    are resolved on first use and stored on it. Resolution is deferred
+    until then so forward references can be defined after the class.
+
+    Args:
+        cls: The settings class
+
+    Returns:
+        Dictionary with the class "type_hints", "class_doc", "field_docs",
+        the JSON "field_comments" and "comment_fragment", and
+        "env_converters" (field name to env var string converter)
+    """
+    meta = cls.__dict__.get("_settings_meta")
+    if meta is None:
+        type_hints = cached_type_hints(cls)
+        class_doc, field_docs = _extract_docstring_comments(cls)
+        # Comment entries added to JSON output, in output order
+        field_comments = tuple(
+            (field_name, f"_{field_name}_comment", doc)
+            for field_name, doc in field_docs.items()
+            if doc
+        )
+        comment_fragment = {"_comment": class_doc} if class_doc else {}
+        comment_fragment.update((key, doc) for _, key, doc in field_comments)
+
+        meta = {
+            "type_hints": type_hints,
+            "class_doc": class_doc,
+            "field_docs": field_docs,
+            "field_comments": field_comments,
+            "comment_fragment": comment_fragment,
+            "env_converters": {
+                field.name: _env_converter(type_hints.get(field.name, str))
+                for field in fields(cls)
+            },
+        }
+        cls._settings_meta = meta
+    return meta
+
+
+def _field_defaults(cls: Type) -> Dict[str, Any]:
+    """
+    Get the default value of each field of a settings class.
+
+    Default factories are called once, on first use, and the results are
+    stored on the class. They are only compared against, never handed out,
+    so mutable defaults can't leak into instances.
+
+    Args:
+        cls: The settings class
+
+    Returns:
+        Dictionary of field name to default value, or MISSING for fields
+        without a usable default
+    """
+    defaults = cls.__dict__.get("_settings_defaults")
+    if defaults is None:
+        defaults = {}
+        for field in fields(cls):
+            if field.default is not MISSING:
+                defaults[field.name] = field.default
+            elif field.default_factory is not MISSING:
+                try:
+                    defaults[field.name] = field.default_factory()
+                except Exception:
+                    # If we can't create default, always include the value
+                    defaults[field.name] = MISSING
+            else:
+                defaults[field.name] = MISSING
+        cls._settings_defaults = defaults
+    return defaults
+
+
+def _build_env_index(cls: Type, prefix: str) -> Dict[str, str]:
+    """
+    Map environment variable names to the fields they set.
+
+    Args:
+        cls: The settings class
+        prefix: Environment variable prefix
+
+    Returns:
+        Dictionary of environment variable name to field name
+    """
+    # Interned so lookups against the environment's keys can match by identity
+    return {
+        sys.intern(prefix + field.name.upper()): sys.intern(field.name)
+        for field in fields(cls)
+    }
+
+
 def _load_from_env(
-    cls: Type, prefix: str, delimiter: str, case_sensitive: bool
+    cls: Type,
+    prefix: str,
+    delimiter: str,
+    case_sensitive: bool,
+    environ: Optional[Mapping[str, str]] = None,
 ) -> Dict[str, Any]:
     """
     Load configuration from environment variables.
@@ -321,200 +591,367 @@ def _load_from_env(
         prefix: Environment variable prefix
         delimiter: Delimiter for nested fields
         case_sensitive: Whether variable names are case-sensitive
+        environ: Environment to read from (default: os.environ)
 
     Returns:
         Dictionary of loaded values
     """
+    if environ is None:
+        environ = os.environ
+
     config = {}
-    type_hints = get_type_hints(cls)
+    converters = _settings_meta(cls)["env_converters"]
+
+    # Mapping of env var names to field names, built when decorated. The
+    # prefix in _settings_config can be changed later, so the mapping is
+    # kept with the prefix it was built for and rebuilt if that differs.
+    env_index = cls.__dict__.get("_env_index")
+    if env_index is None or env_index[0] != prefix:
+        env_index = (prefix, _build_env_index(cls, prefix))
+        cls._env_index = env_index
+    env_map = env_index[1]
+
+    if case_sensitive:
+        # Names must match exactly, so look each one up directly
+        matches = ((env_name, environ.get(env_name)) for env_name in env_map)
+    else:
+        # Check environment variables, ignoring case. Comparing just the
+        # prefix first avoids upper-casing every unrelated variable name.
+        prefix_len = len(prefix)
+        matches = (
+            (env_name.upper(), env_value)
+            for env_name, env_value in environ.items()
+            if env_name[:prefix_len].upper() == prefix
+        )
+
+    for env_name, env_value in matches:
+        # Check if this env var is for our config
+        field_name = env_map.get(env_name)
+        if field_name is None or env_value is None:
+            continue
 
-    # Build mapping of env var names to field names
-    env_map = {}
-    for field in fields(cls):
-        if case_sensitive:
-            env_name = prefix + field.name.upper()
-        else:
-            env_name = prefix + field.name.upper()
-        env_map[env_name] = field.name
+        # Convert the string value to the appropriate type
+        try:
+            value = converters[field_name](env_value)
+            config[field_name] = value
+        except (ValueError, TypeError):
+            # Skip values that can't be converted
+            pass
 
-    # Check environment variables
-    for env_name, env_value in os.environ.items():
-        if not case_sensitive:
-            env_name = env_name.upper()
+    return config
 
-        # Check if this env var is for our config
-        if env_name in env_map:
-            field_name = env_map[env_name]
-            field_type = type_hints.get(field_name, str)
 
-            # Convert the string value to the appropriate type
-            try:
-                value = _convert_env_value(env_value, field_type)
-                config[field_name] = value
-            except (ValueError, TypeError):
-                # Skip values that can't be converted
-                pass
+def _env_bool(value: str) -> bool:
+    """Convert an environment variable string to bool."""
+    # Common spellings match exactly, without building a lowercase copy
+    if value in _TRUE_VALUES:
+        return True
+    if value in _FALSE_VALUES:
+        return False
+    return value.lower() in _TRUE_VALUES
+
+
+def _spellings(*words: str) -> frozenset:
+    """Get the lower, Title and UPPER case spellings of words."""
+    return frozenset(
+        spelling
+        for word in words
+        for spelling in (word, word.title(), word.upper())
+    )
+
+
+# Env var strings read as True; anything else is False
+_TRUE_VALUES = _spellings("true", "1", "yes", "on", "enabled")
+_FALSE_VALUES = _spellings("false", "0", "no", "off", "disabled")
 
-    return config
 
+# Conversion of a non-null env var string, by basic target type
+_COERCERS = {bool: _env_bool, int: int, float: float, str: str}
 
-def _convert_env_value(value: str, target_type: Type) -> Any:
+# Strings that convert to None for basic types
+_NULL_VALUES = frozenset({"none", "null", ""})
+
+
+def _env_converter(target_type: Type) -> Callable[[str], Any]:
+    """
+    Get the env var converter for a target type.
+
+    Converters are cached per type, so the type is only inspected once.
+
+    Args:
+        target_type: The type to convert to
+
+    Returns:
+        A function converting an environment variable string
     """
-    Convert environment variable string to target type.
+    try:
+        return _cached_env_converter(target_type, repr(target_type))
+    except TypeError:
+        # Unhashable annotations skip the cache
+        return _compile_env_converter(target_type)
 
-    Handles:
-    - Basic types (bool, int, float, str)
-    - List types (comma-separated)
-    - Dict types (key=value pairs)
-    - Optional types
+
+def _compile_env_converter(target_type: Type) -> Callable[[str], Any]:
     """
+    Build a function converting env var strings to a single target type.
+
+    All dispatch on the type (Optional, containers, basic types) happens
+    here, once, instead of on every environment variable conversion.
 
+    Args:
+        target_type: The type to convert to
+
+    Returns:
+        A function converting an environment variable string
+    """
     # Get origin for generic types
     origin = get_origin(target_type)
 
     # Handle Optional types
     if origin is Union:
-        args = get_args(target_type)
-        # Check if it's explicitly None/null
-        if value.lower() in ("none", "null"):
-            return None
         # Try each type in the union
-        for arg_type in args:
-            if arg_type is type(None):
-                continue
-            try:
-                return _convert_env_value(value, arg_type)
-            except:
-                continue
-        return value
+        arg_converters = tuple(
+            _env_converter(arg_type)
+            for arg_type in get_args(target_type)
+            if arg_type is not type(None)
+        )
+
+        def convert_union(value: str) -> Any:
+            # Check if it's explicitly None/null
+            if value.lower() in ("none", "null"):
+                return None
+            for convert in arg_converters:
+                try:
+                    return convert(value)
+                except Exception:
+                    continue
+            return value
+
+        return convert_union
 
     # Handle List types
     if origin is list or target_type is list:
-        if not value.strip():
-            return []
+        args = get_args(target_type)
+        item_type = args[0] if args else None
+
+        def convert_list(value: str) -> List[Any]:
+            if not value.strip():
+                return []
 
-        # Split by comma, strip whitespace
-        items = [item.strip() for item in value.split(",")]
+            # Split by comma, strip whitespace
+            items = list(map(str.strip, value.split(",")))
 
-        # If we have type args, convert each item
-        if origin is list:
-            args = get_args(target_type)
-            if args:
-                item_type = args[0]
-                items = [_convert_env_value(item, item_type) for item in items]
+            # If we have type args, convert each item
+            if item_type is not None:
+                items = _convert_env_items(items, item_type)
+            return items
 
-        return items
+        return convert_list
 
     # Handle Dict types
     if origin is dict or target_type is dict:
-        if not value.strip():
-            return {}
+        args = get_args(target_type)
+        key_type, val_type = args if len(args) == 2 else (str, None)
 
-        result = {}
-        # Support both JSON and key=value format
-        if value.startswith("{"):
-            # Try JSON format
-            try:
-                import json
-
-                return json.loads(value)
-            except:
-                pass
-
-        # Parse key=value pairs
-        for pair in value.split(","):
-            if "=" in pair:
-                k, v = pair.split("=", 1)
-                k = k.strip()
-                v = v.strip()
-
-                # If we have type args, convert the value
-                if origin is dict:
-                    args = get_args(target_type)
-                    if len(args) >= 2:
-                        key_type, val_type = args[0], args[1]
-                        k = (
-                            _convert_env_value(k, key_type)
-                            if key_type != str
-                            else k
-                        )
-                        v = _convert_env_value(v, val_type)
+        def convert_dict(value: str) -> Dict[Any, Any]:
+            if not value.strip():
+                return {}
+
+            # Support both JSON and key=value format
+            if value.startswith("{"):
+                # Try JSON format
+                try:
+                    return json.loads(value)
+                except ValueError:
+                    pass
 
-                result[k] = v
+            # Parse key=value pairs
+            pairs = [
+                pair.split("=", 1) for pair in value.split(",") if "=" in pair
+            ]
+            keys = [k.strip() for k, _ in pairs]
+            values = [v.strip() for _, v in pairs]
 
-        return result
+            # If we have type args, convert the keys and values
+            if key_type != str:
+                keys = _convert_env_items(keys, key_type)
+            if val_type is not None:
+                values = _convert_env_items(values, val_type)
 
-    # Handle None/null for basic types
-    if value.lower() in ("none", "null", ""):
-        return None
+            return dict(zip(keys, values))
+
+        return convert_dict
 
     # Handle basic types
-    if target_type == bool:
-        return value.lower() in ("true", "1", "yes", "on", "enabled")
-    elif target_type == int:
-        return int(value)
-    elif target_type == float:
-        return float(value)
-    elif target_type == str:
-        return value
-    else:
-        # For other types, try to call the type directly
-        try:
-            return target_type(value)
-        except:
-            return value
+    cast = _COERCERS.get(target_type) if isinstance(target_type, type) else None
+    if cast is None:
+
+        def cast(value: str) -> Any:
+            # For other types, try to call the type directly
+            try:
+                return target_type(value)
+            except Exception:
+                return value
+
+    def convert_basic(value: str) -> Any:
+        # Handle None/null for basic types
+        if value.lower() in _NULL_VALUES:
+            return None
+        return cast(value)
+
+    return convert_basic
+
+
+@lru_cache(maxsize=1024)
+def _cached_env_converter(
+    target_type: Type, type_repr: str
+) -> Callable[[str], Any]:
+    """
+    Cache wrapper around _compile_env_converter().
+
+    type_repr is part of the key because Union types compare equal
+    regardless of argument order, but the order decides conversion.
+    """
+    return _compile_env_converter(target_type)
+
+
+def _convert_env_items(items: List[str], item_type: Type) -> List[Any]:
+    """
+    Convert the stripped items of a list or dict env var to a type.
+
+    Args:
+        items: The string items
+        item_type: The type to convert each item to
+
+    Returns:
+        List of converted items
+    """
+    cast = _COERCERS.get(item_type) if isinstance(item_type, type) else None
+    if cast is None:
+        return list(map(_env_converter(item_type), items))
+
+    # Without null markers every item goes through the cast as-is
+    if _NULL_VALUES.isdisjoint(map(str.lower, items)):
+        return list(map(cast, items))
+    return [
+        None if item.lower() in _NULL_VALUES else cast(item) for item in items
+    ]
 
 
 def _extract_docstring_comments(cls: Type) -> Tuple[str, Dict[str, str]]:
     """
     Extract class and field documentation from docstrings.
 
+    Field documentation uses the numpydoc layout: a `field_name : type`
+    line followed by the description. Headers naming something that isn't
+    an attribute of the class stay in the class documentation.
+
     Args:
         cls: The settings class
 
     Returns:
         Tuple of (class_doc, field_docs)
     """
-    class_doc = ""
+    if not cls.__doc__:
+        return "", {}
+
+    doc = cls.__doc__.strip()
+
+    # Only which headers name attributes depends on the class itself
+    attr_names = frozenset(
+        field_name
+        for field_name, _, _ in _docstring_headers(doc)
+        if hasattr(cls, field_name)
+    )
+    class_doc, field_docs = _parse_class_doc(doc, attr_names)
+    return class_doc, dict(field_docs)
+
+
+@lru_cache(maxsize=256)
+def _parse_class_doc(
+    doc: str, attr_names: FrozenSet[str]
+) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+    """
+    Split a docstring into class and field documentation.
+
+    Cached by docstring text and the documented attribute names, so
+    identical classes (such as classes redefined in tests) share one parse.
+
+    Args:
+        doc: The stripped class docstring
+        attr_names: Header names that are attributes of the class
+
+    Returns:
+        Tuple of (class_doc, ((field_name, field_doc), ...))
+    """
+    class_parts = []
     field_docs = {}
 
-    if cls.__doc__:
-        lines = cls.__doc__.strip().split("\n")
-        class_lines = []
-        current_field = None
-
-        # Parse docstring to extract field documentation
-        for line in lines:
-            line = line.strip()
-
-            # Check if this is a field documentation (field_name : type)
-            if " : " in line and not line.startswith(" "):
-                parts = line.split(" : ", 1)
-                field_name = parts[0].strip()
-                # Check if this field exists in the class
-                if hasattr(cls, field_name):
-                    current_field = field_name
-                    field_docs[field_name] = []
-                else:
-                    current_field = None
-                    class_lines.append(line)
-            elif current_field and line:
-                # This is documentation for the current field
-                field_docs[current_field].append(line)
-            elif not current_field:
-                # This is part of the class documentation
-                class_lines.append(line)
+    # Walk the docstring one header to the next; each span of text
+    # belongs to the class or to the field documented above it
+    current_field = None
+    start = 0
+    for field_name, header_start, header_end in _docstring_headers(doc):
+        _append_doc_text(
+            doc[start:header_start],
+            current_field,
+            class_parts,
+            field_docs,
+        )
+
+        # Check if this field exists in the class
+        if field_name in attr_names:
+            current_field = field_name
+            field_docs[field_name] = []
+            start = header_end
+        else:
+            # Not a field, so the header line is class documentation
+            current_field = None
+            start = header_start
+
+    _append_doc_text(doc[start:], current_field, class_parts, field_docs)
+
+    # Join class and field documentation
+    class_doc = "".join(class_parts).strip()
+    return class_doc, tuple(
+        (field_name, " ".join(doc_lines).strip())
+        for field_name, doc_lines in field_docs.items()
+    )
+
+
+@lru_cache(maxsize=256)
+def _docstring_headers(doc: str) -> Tuple[Tuple[str, int, int], ...]:
+    """
+    Find the `field_name : type` header lines in a docstring.
+
+    Cached by docstring text, so classes that share a docstring (such as
+    classes redefined in tests) only scan it once.
+
+    Args:
+        doc: The stripped class docstring
 
-        # Join class documentation
-        if class_lines:
-            class_doc = "\n".join(class_lines).strip()
+    Returns:
+        Tuple of (field_name, start, end) for each header line
+    """
+    return tuple(
+        (match.group(1).strip(), match.start(), match.end())
+        for match in _FIELD_DOC_RE.finditer(doc)
+    )
 
-        # Join field documentation
-        for field_name, doc_lines in field_docs.items():
-            if doc_lines:
-                field_docs[field_name] = " ".join(doc_lines).strip()
 
-    return class_doc, field_docs
+def _append_doc_text(
+    text: str,
+    field_name: Optional[str],
+    class_parts: List[str],
+    field_docs: Dict[str, List[str]],
+) -> None:
+    """Add a span of docstring text to the class or a field's documentation."""
+    text = _INDENT_STRIP_RE.sub("", text)
+    if field_name is None:
+        class_parts.append(text)
+    else:
+        # Field descriptions drop blank lines
+        field_docs[field_name].extend(line for line in text.split("\n") if line)
 
 
 def _add_comments(cls: Type, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -523,15 +960,73 @@ def _add_comments(cls: Type, data: Dict[str, Any]) -> Dict[str, Any]:
 
     This is kept for backward compatibility and JSON-specific handling.
     """
-    class_doc, field_docs = _extract_docstring_comments(cls)
+    data.update(_json_comments(cls, data))
+    return data
 
-    if class_doc:
-        data["_comment"] = class_doc
 
-    for field_name, doc in field_docs.items():
-        if field_name in data and doc:
-            data[f"_{field_name}_comment"] = doc
+def _json_comments(cls: Type, data: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Get the comment entries to add to JSON data.
+
+    Args:
+        cls: The settings class
+        data: The data being saved
+
+    Returns:
+        The class comment plus a comment for each documented field in data
+    """
+    meta = _settings_meta(cls)
+    field_comments = meta["field_comments"]
+
+    # Usually every field is saved, so the precomputed entries apply as-is
+    if all(field_name in data for field_name, _, _ in field_comments):
+        return meta["comment_fragment"]
+
+    comments = {"_comment": meta["class_doc"]} if meta["class_doc"] else {}
+    comments.update(
+        (key, doc)
+        for field_name, key, doc in field_comments
+        if field_name in data
+    )
+    return comments
+
+
+def _comment_header(class_doc: str) -> str:
+    """
+    Format class documentation as a block of `#` comment lines.
 
+    Args:
+        class_doc: The class documentation, possibly empty
+
+    Returns:
+        The comment lines followed by a blank line, or "" without docs
+    """
+    if not class_doc:
+        return ""
+    return "".join(f"# {line}\n" for line in class_doc.split("\n")) + "\n"
+
+
+def _settings_data(obj: Any, include_defaults: bool) -> Dict[str, Any]:
+    """
+    Get the data to save for a settings instance.
+
+    Args:
+        obj: The settings instance
+        include_defaults: Whether to include fields with default values
+
+    Returns:
+        Dictionary of field values to save
+    """
+    if include_defaults:
+        return Converter.to_dict(obj)
+
+    # Only save values that differ from their defaults;
+    # required fields have no default and are always saved
+    data = {}
+    for name, default in _field_defaults(obj.__class__).items():
+        value = getattr(obj, name)
+        if default is MISSING or value != default:
+            data[name] = value
     return data
 
 
@@ -550,68 +1045,69 @@ def _save_with_format_aware_comments(
         data: Data to save
         path: File path
         include_comments: Whether to include comments
-        **kwargs: Additional format-specific options
+        **kwargs: Additional format-specific options, such as
+            max_comment_fields to limit the YAML field comments
+            (default: MAX_COMMENT_FIELDS)
     """
     path_obj = Path(path)
     ext = path_obj.suffix.lower()
 
+    if ext not in _CONFIG_EXTENSIONS:
+        raise ValueError(f"Unsupported format: {ext}")
+
+    # Without comments, use the FormatHandler dumpers; JSON comments are
+    # plain data, so those files are written by the JSON dumper too
     if not include_comments:
-        # No comments - use appropriate format handler
-        if ext == ".json":
-            import json
+        _, dumper = _get_handlers(ext)
+        dumper(data, path_obj, **kwargs)
+    elif ext == ".json":
+        _dump_json({**data, **_json_comments(cls, data)}, path_obj, **kwargs)
+    else:
+        # Render the whole file in memory so it is written in one go
+        buf = io.StringIO()
+        _write_with_format_aware_comments(
+            cls, data, buf, ext, include_comments, **kwargs
+        )
+        _write_bytes(path_obj, buf.getvalue().encode("utf-8"))
 
-            with open(path_obj, "w") as f:
-                json.dump(data, f, indent=kwargs.get("indent", 2))
-        elif ext in [".yaml", ".yml"]:
-            try:
-                import yaml
-
-                with open(path_obj, "w") as f:
-                    yaml.dump(
-                        data,
-                        f,
-                        default_flow_style=False,
-                        sort_keys=kwargs.get("sort_keys", False),
-                    )
-            except ImportError:
-                raise ImportError("PyYAML required for YAML support")
-        elif ext == ".toml":
-            try:
-                import tomli_w
 
-                with open(path_obj, "wb") as f:
-                    tomli_w.dump(data, f)
-            except ImportError:
-                raise ImportError("tomli-w required for TOML support")
-        elif ext == ".ini":
-            # For INI, we need special handling
-            import configparser
+def _write_with_format_aware_comments(
+    cls: Type,
+    data: Dict[str, Any],
+    f: TextIO,
+    ext: str,
+    include_comments: bool,
+    **kwargs,
+) -> None:
+    """
+    Write data to a text stream with format-appropriate comment handling.
 
-            parser = configparser.ConfigParser()
-            for key, value in data.items():
-                parser.set("DEFAULT", key, str(value))
-            with open(path_obj, "w") as f:
-                parser.write(f)
-        else:
+    Args:
+        cls: The class with docstrings
+        data: Data to save
+        f: Text stream to write to
+        ext: Lowercase file extension naming the format, e.g. ".json"
+        include_comments: Whether to include comments
+        **kwargs: Additional format-specific options, as for
+            _save_with_format_aware_comments
+    """
+    if not include_comments:
+        # No comments - render exactly what the FormatHandler dumper writes
+        dumps = _STRING_DUMPERS.get(ext)
+        if dumps is None:
             raise ValueError(f"Unsupported format: {ext}")
+        f.write(dumps(data, **kwargs))
         return
 
     # Extract comments
-    class_doc, field_docs = _extract_docstring_comments(cls)
+    meta = _settings_meta(cls)
+    class_doc, field_docs = meta["class_doc"], meta["field_docs"]
 
     if ext == ".json":
         # For JSON, add comment fields to data
-        save_data = data.copy()
-        if class_doc:
-            save_data["_comment"] = class_doc
-        for field_name, doc in field_docs.items():
-            if field_name in save_data and doc:
-                save_data[f"_{field_name}_comment"] = doc
+        save_data = {**data, **_json_comments(cls, data)}
 
-        import json
-
-        with open(path_obj, "w") as f:
-            json.dump(save_data, f, indent=kwargs.get("indent", 2))
+        f.write(_dumps_json(save_data, **kwargs))
 
     elif ext in [".yaml", ".yml"]:
         # For YAML, try to use ruamel.yaml for native comments
@@ -632,36 +1128,29 @@ def _save_with_format_aware_comments(
                 # Add as document-level comment
                 yaml_data.yaml_set_start_comment(class_doc)
 
-            # Add field comments
-            for field_name, doc in field_docs.items():
-                if field_name in yaml_data and doc:
-                    yaml_data.yaml_set_comment_before_after_key(
-                        field_name, before=doc, indent=0
-                    )
+            # Add field comments, up to the configured limit
+            documented = (
+                (field_name, doc)
+                for field_name, _, doc in meta["field_comments"]
+                if field_name in yaml_data
+            )
+            max_fields = kwargs.get("max_comment_fields", MAX_COMMENT_FIELDS)
+            for field_name, doc in islice(documented, max_fields):
+                yaml_data.yaml_set_comment_before_after_key(
+                    field_name, before=doc, indent=0
+                )
 
-            with open(path_obj, "w") as f:
-                yaml.dump(yaml_data, f)
+            yaml.dump(yaml_data, f)
 
         except ImportError:
             # Fallback to PyYAML with manual comment writing
             try:
-                import yaml
-
-                with open(path_obj, "w") as f:
-                    if class_doc:
-                        # Write class comment at the top
-                        for line in class_doc.split("\n"):
-                            f.write(f"# {line}\n")
-                        f.write("\n")
-
-                    # For field comments, we'd need to manually inject them
-                    # which is complex with PyYAML, so just dump normally
-                    yaml.dump(
-                        data,
-                        f,
-                        default_flow_style=False,
-                        sort_keys=kwargs.get("sort_keys", False),
-                    )
+                # For field comments, we'd need to manually inject them
+                # which is complex with PyYAML, so just dump normally
+                body = _dumps_yaml(data, **kwargs)
+
+                # Write class comment at the top
+                f.write(_comment_header(class_doc) + body)
             except ImportError:
                 raise ImportError(
                     "PyYAML or ruamel.yaml required for YAML support"
@@ -688,42 +1177,23 @@ def _save_with_format_aware_comments(
                         doc.add(tomlkit.comment(line))
                 doc.add(key, value)
 
-            with open(path_obj, "w") as f:
-                f.write(tomlkit.dumps(doc))
+            f.write(tomlkit.dumps(doc))
 
         except ImportError:
             # Fallback to tomli-w without comments
             try:
                 import tomli_w
 
-                with open(path_obj, "wb") as f:
-                    tomli_w.dump(data, f)
+                f.write(tomli_w.dumps(data))
             except ImportError:
                 raise ImportError(
                     "tomlkit or tomli-w required for TOML support"
                 )
 
     elif ext == ".ini":
-        # For INI, write comments as actual comments
-        import configparser
-
-        with open(path_obj, "w") as f:
-            if class_doc:
-                for line in class_doc.split("\n"):
-                    f.write(f"# {line}\n")
-                f.write("\n")
-
-            parser = configparser.ConfigParser()
-
-            # Add fields
-            for key, value in data.items():
-                if key in field_docs and field_docs[key]:
-                    # Can't add inline comments with configparser
-                    # so we skip field comments for INI
-                    pass
-                parser.set("DEFAULT", key, str(value))
-
-            parser.write(f)
+        # For INI, write the class docs as actual comments; field comments
+        # are skipped, the body is the same as without comments
+        f.write(_comment_header(class_doc) + _dumps_ini(data, **kwargs))
 
     else:
         raise ValueError(f"Unsupported format: {ext}")
@@ -0,0 +1,41 @@
+"""Helpers for testing code that uses dataclassy settings."""
+
+import os
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+
+@contextmanager
+def env_patch(
+    values: Optional[Dict[str, Optional[str]]] = None, **kwargs: Optional[str]
+) -> Iterator[None]:
+    """
+    Temporarily set environment variables.
+
+    All variables are set together on entry and restored together on exit,
+    including when the block raises.
+
+    Args:
+        values: Variables to set, for names that aren't valid keywords
+        **kwargs: Variables to set; a value of None unsets the variable
+
+    Example:
+        with env_patch(MYAPP_DEBUG="true", MYAPP_PORT="9090"):
+            config = AppConfig.load_config()
+    """
+    patch = {**(values or {}), **kwargs}
+    saved = {name: os.environ.get(name) for name in patch}
+
+    to_set = {name: value for name, value in patch.items() if value is not None}
+    os.environ.update(to_set)
+    for name in patch.keys() - to_set.keys():
+        os.environ.pop(name, None)
+
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
@@ -2,7 +2,7 @@
 
 from dataclasses import MISSING
 from enum import Enum
-from typing import Any, Type, TypeVar
+from typing import Any, Dict, Type, TypeVar, get_type_hints
 
 T = TypeVar("T", bound=Enum)
 
@@ -18,27 +18,74 @@ def enum_converter(enum_class: Type[T]) -> callable:
         A converter function that accepts various input formats
     """
 
+    # Build lookup tables once so conversion is a dict hit, not a scan.
+    # Enum keeps its own value-to-member map for hashable values; members
+    # with unhashable values are still handled by enum_class() below.
+    by_value = dict(enum_class._value2member_map_)
+    by_name = {}
+    for member in enum_class:
+        by_name.setdefault(member.name.lower(), member)
+
+    # For hashable values, enum_class() can only find more members through
+    # a custom _missing_ hook (as Flag has). Without one the call is bound
+    # to fail, so it is skipped rather than paying for the error it builds.
+    has_missing_hook = (
+        getattr(enum_class._missing_, "__func__", None)
+        is not Enum._missing_.__func__
+    )
+
     def convert(value: Any) -> T:
         if isinstance(value, enum_class):
             return value
 
         # Try by value
         try:
-            return enum_class(value)
-        except ValueError:
-            pass
+            member = by_value.get(value)
+            ask_enum = has_missing_hook
+        except TypeError:
+            member = None
+            ask_enum = True
+        if member is not None:
+            return member
 
         # Try by name (case-insensitive)
         if isinstance(value, str):
-            for member in enum_class:
-                if member.name.lower() == value.lower():
-                    return member
+            member = by_name.get(value.lower())
+            if member is not None:
+                return member
+
+        # Let the enum itself have a go (unhashable values, _missing_ hooks)
+        if ask_enum:
+            try:
+                return enum_class(value)
+            except ValueError:
+                pass
 
         raise ValueError(f"Cannot convert '{value}' to {enum_class.__name__}")
 
     return convert
 
 
+def cached_type_hints(cls: type) -> Dict[str, Any]:
+    """
+    Resolve type hints for a class, caching the result on the class.
+
+    typing.get_type_hints() evaluates forward references and walks the MRO,
+    so it is resolved once per class on first use and reused afterwards.
+
+    Args:
+        cls: The class to get type hints for
+
+    Returns:
+        Dictionary mapping attribute names to resolved types
+    """
+    hints = cls.__dict__.get("__dataclassy_hints__")
+    if hints is None:
+        hints = get_type_hints(cls)
+        cls.__dataclassy_hints__ = hints
+    return hints
+
+
 def merge_configs(base: dict, override: dict, strategy: str = "deep") -> dict:
     """
     Merge two configuration dictionaries.
@@ -51,20 +98,16 @@ def merge_configs(base: dict, override: dict, strategy: str = "deep") -> dict:
     Returns:
         Merged configuration dictionary
     """
+    # Top-level keys are merged in C; only nested dicts need more work
+    result = {**base, **override}
     if strategy == "shallow":
-        return {**base, **override}
-
-    result = base.copy()
+        return result
 
     for key, value in override.items():
-        if (
-            key in result
-            and isinstance(result[key], dict)
-            and isinstance(value, dict)
-        ):
-            result[key] = merge_configs(result[key], value, strategy)
-        else:
-            result[key] = value
+        if isinstance(value, dict):
+            base_value = base.get(key)
+            if isinstance(base_value, dict):
+                result[key] = merge_configs(base_value, value, strategy)
 
     return result
 
@@ -111,6 +111,23 @@ def test_frozen_dataclassy():
         p.x = 3.0
 
 
+def test_slotted_dataclassy():
+    """Test that slots=True keeps enum conversion and serialization."""
+
+    @dataclassy(slots=True)
+    class Task:
+        title: str
+        status: Status = Status.PENDING
+
+    task = Task("write", "active")
+    assert task.status == Status.ACTIVE
+    assert not hasattr(task, "__dict__")
+
+    loaded = Task.from_dict({"title": "read", "status": "INACTIVE"})
+    assert loaded.status == Status.INACTIVE
+    assert loaded.to_dict() == {"title": "read", "status": Status.INACTIVE}
+
+
 def test_with_default_factory():
     """Test field with default_factory."""
 
@@ -6,6 +6,7 @@ from typing import List, Optional, Dict, Union
 from dataclasses import FrozenInstanceError
 
 from dataclassy import dataclassy
+from dataclassy.serialization.converter import Converter
 from dataclassy.utils import enum_converter, merge_configs, is_missing, MISSING
 
 
@@ -69,31 +70,63 @@ def test_enum_converter_invalid_inputs(enum_class, input_value, error_msg):
         converter(input_value)
 
 
+def test_enum_converter_uses_missing_hook():
+    """Test that enums with a _missing_ hook still get to resolve values."""
+    from enum import Flag
+
+    class Level(Enum):
+        LOW = 1
+        HIGH = 2
+
+        @classmethod
+        def _missing_(cls, value):
+            return cls.HIGH if value == "max" else None
+
+    class Perm(Flag):
+        READ = 1
+        WRITE = 2
+
+    assert enum_converter(Level)("max") is Level.HIGH
+    assert enum_converter(Perm)(3) == Perm.READ | Perm.WRITE
+
+    with pytest.raises(ValueError, match="Cannot convert 'min' to Level"):
+        enum_converter(Level)("min")
+
+
 @pytest.mark.parametrize(
     "base,override,strategy,expected",
     [
-        # Shallow merge
-        (
+        pytest.param(
             {"a": 1, "b": 2},
             {"b": 3, "c": 4},
             "shallow",
             {"a": 1, "b": 3, "c": 4},
+            id="shallow_basic",
         ),
-        # Deep merge - nested dicts
-        (
+        pytest.param(
             {"a": {"x": 1, "y": 2}, "b": 3},
             {"a": {"y": 20, "z": 30}, "c": 4},
             "deep",
             {"a": {"x": 1, "y": 20, "z": 30}, "b": 3, "c": 4},
+            id="deep_nested_dicts",
         ),
-        # Deep merge - override non-dict with dict
-        ({"a": 1, "b": 2}, {"a": {"x": 10}}, "deep", {"a": {"x": 10}, "b": 2}),
-        # Deep merge - override dict with non-dict
-        ({"a": {"x": 1}, "b": 2}, {"a": 42}, "deep", {"a": 42, "b": 2}),
-        # Empty dicts
-        ({}, {"a": 1}, "deep", {"a": 1}),
-        ({"a": 1}, {}, "deep", {"a": 1}),
-        ({}, {}, "deep", {}),
+        pytest.param(
+            {"a": 1, "b": 2},
+            {"a": {"x": 10}},
+            "deep",
+            {"a": {"x": 10}, "b": 2},
+            id="deep_non_dict_to_dict",
+        ),
+        pytest.param(
+            {"a": {"x": 1}, "b": 2},
+            {"a": 42},
+            "deep",
+            {"a": 42, "b": 2},
+            id="deep_dict_to_non_dict",
+        ),
+        pytest.param({}, {"a": 1}, "deep", {"a": 1}, id="empty_base"),
+        pytest.param({"a": 1}, {}, "deep", {"a": 1}, id="empty_override"),
+        pytest.param({}, {}, "deep", {}, id="both_empty"),
     ],
 )
 def test_merge_configs(base, override, strategy, expected):
@@ -179,35 +212,44 @@ def test_type_coercion_edge_cases(
     assert type(result.value) == expected_type
 
 
-def test_union_type_handling():
-    """Test handling of Union types beyond Optional."""
+@dataclassy
+class MultiType:
+    # Union of multiple types
+    value: Union[int, str, bool]
+    # Union with None in the middle
+    optional_middle: Union[int, None, str]
+    # Nested union
+    nested: Union[List[int], Dict[str, str], None]
 
-    @dataclassy
-    class MultiType:
-        # Union of multiple types
-        value: Union[int, str, bool]
-        # Union with None in the middle
-        optional_middle: Union[int, None, str]
-        # Nested union
-        nested: Union[List[int], Dict[str, str], None]
-
-    # Test first type matches
-    data1 = {"value": 42, "optional_middle": None, "nested": [1, 2, 3]}
-    result1 = MultiType.from_dict(data1)
-    assert result1.value == 42
-    assert result1.optional_middle is None
-    assert result1.nested == [1, 2, 3]
-
-    # Test fallback to later types
-    data2 = {
-        "value": "hello",
-        "optional_middle": "world",
-        "nested": {"key": "value"},
-    }
-    result2 = MultiType.from_dict(data2)
-    assert result2.value == "hello"
-    assert result2.optional_middle == "world"
-    assert result2.nested == {"key": "value"}
+
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        pytest.param(
+            {"value": 42, "optional_middle": None, "nested": [1, 2, 3]},
+            {"value": 42, "optional_middle": None, "nested": [1, 2, 3]},
+            id="first_type_matches",
+        ),
+        pytest.param(
+            {
+                "value": "hello",
+                "optional_middle": "world",
+                "nested": {"key": "value"},
+            },
+            {
+                "value": "hello",
+                "optional_middle": "world",
+                "nested": {"key": "value"},
+            },
+            id="fallback_to_later_types",
+        ),
+    ],
+)
+def test_union_type_handling(data, expected):
+    """Test handling of Union types beyond Optional."""
+    result = MultiType.from_dict(data)
+    for name, value in expected.items():
+        assert getattr(result, name) == value
 
 
 def test_deeply_nested_edge_cases():
@@ -259,8 +301,6 @@ def test_non_dataclass_from_dict():
     class NotDataclass:
         pass
 
-    from dataclassy.serialization.converter import Converter
-
     data = {"key": "value"}
     result = Converter.from_dict(NotDataclass, data)
     assert result == data
@@ -324,7 +364,8 @@ def test_slots_dataclass():
     assert obj2.name == "default"
 
     # Should not have __dict__
-    assert not hasattr(obj, "__dict__")
+    assert SlottedClass.__slots__ == ("value", "name")
+    assert "__dict__" not in SlottedClass.__dict__
 
 
 def test_error_handling_in_conversion():
@@ -364,8 +405,7 @@ def test_from_dict_with_extra_fields():
     result = Simple.from_dict(data)
     assert result.a == 1
     assert result.b == "test"
-    assert not hasattr(result, "c")
-    assert not hasattr(result, "d")
+    assert set(vars(result)).isdisjoint({"c", "d"})
 
 
 @pytest.mark.parametrize("frozen", [True, False])
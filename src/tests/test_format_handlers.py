@@ -1,12 +1,21 @@
 """Tests for file format handlers."""
 
+import importlib.util
+import json
+import math
 import pytest
+import uuid
+from datetime import datetime
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
 from dataclassy import dataclassy
 from dataclassy.serialization.formats import FormatHandler
 
+# Optional format libraries, checked once without importing them
+HAS_YAML = importlib.util.find_spec("yaml") is not None
+HAS_TOMLI_W = importlib.util.find_spec("tomli_w") is not None
+
 
 @dataclassy
 class SimpleConfig:
@@ -85,10 +94,9 @@ def test_json_formatting_options():
         assert "\n" not in content_compact.strip()  # Single line
 
 
+@pytest.mark.skipif(not HAS_YAML, reason="PyYAML required")
 def test_yaml_round_trip():
     """Test saving and loading YAML files."""
-    pytest.importorskip("yaml")
-
     config = SimpleConfig(name="test", value=42, enabled=True)
 
     with TemporaryDirectory() as tmpdir:
@@ -102,10 +110,9 @@ def test_yaml_round_trip():
         assert loaded.enabled is True
 
 
+@pytest.mark.skipif(not HAS_TOMLI_W, reason="tomli-w required")
 def test_toml_round_trip():
     """Test saving and loading TOML files."""
-    pytest.importorskip("tomli_w")
-
     config = SimpleConfig(name="test", value=42, enabled=False)
 
     with TemporaryDirectory() as tmpdir:
@@ -168,6 +175,28 @@ def test_ini_round_trip_multi_section():
         assert loaded.cache.value == 6379
 
 
+def test_ini_percent_signs_round_trip():
+    """Test values with % signs are written so they load back unchanged."""
+    config = NestedConfig(
+        database=SimpleConfig(name="50%", value=1),
+        cache=SimpleConfig(name="%(name)s and 100%%", value=2),
+    )
+
+    with TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "percent.ini"
+
+        FormatHandler.to_path(config, path)
+        loaded = FormatHandler.from_path(NestedConfig, path)
+
+        assert loaded.database.name == "50%"
+        assert loaded.cache.name == "%(name)s and 100%%"
+
+        # Top-level values are loaded without interpolation, so a lone %
+        # is rejected when saving, as configparser does
+        with pytest.raises(ValueError, match="invalid interpolation"):
+            FormatHandler.to_path(SimpleConfig(name="10% off", value=3), path)
+
+
 def test_auto_create_parent_directory():
     """Test that parent directories are created automatically."""
     config = SimpleConfig(name="test", value=42)
@@ -211,58 +240,154 @@ def test_unsupported_format_error():
             FormatHandler.from_path(SimpleConfig, path)
 
 
-def test_missing_yaml_library():
+def test_missing_yaml_library(monkeypatch):
     """Test error when PyYAML is not installed."""
     import sys
 
-    # Temporarily hide yaml module
-    yaml_module = sys.modules.get("yaml")
-    if yaml_module:
-        sys.modules["yaml"] = None
-
-    try:
-        config = SimpleConfig(name="test", value=42)
+    # Hide yaml module, whether or not it was imported yet
+    monkeypatch.setitem(sys.modules, "yaml", None)
 
-        with TemporaryDirectory() as tmpdir:
-            path = Path(tmpdir) / "config.yaml"
+    config = SimpleConfig(name="test", value=42)
 
-            with pytest.raises(ImportError, match="PyYAML is required"):
-                FormatHandler.to_path(config, path)
+    with TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "config.yaml"
 
-            # Create dummy file
-            path.write_text("name: test\nvalue: 42\n")
+        with pytest.raises(ImportError, match="PyYAML is required"):
+            FormatHandler.to_path(config, path)
 
-            with pytest.raises(ImportError, match="PyYAML is required"):
-                FormatHandler.from_path(SimpleConfig, path)
+        # Create dummy file
+        path.write_text("name: test\nvalue: 42\n")
 
-    finally:
-        # Restore yaml module
-        if yaml_module:
-            sys.modules["yaml"] = yaml_module
+        with pytest.raises(ImportError, match="PyYAML is required"):
+            FormatHandler.from_path(SimpleConfig, path)
 
 
-def test_missing_toml_library():
+def test_missing_toml_library(monkeypatch):
     """Test error when tomli-w is not installed."""
     import sys
 
-    # Temporarily hide toml modules
-    tomli_w_module = sys.modules.get("tomli_w")
-    if tomli_w_module:
-        sys.modules["tomli_w"] = None
+    # Hide toml module, whether or not it was imported yet
+    monkeypatch.setitem(sys.modules, "tomli_w", None)
+
+    config = SimpleConfig(name="test", value=42)
+
+    with TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "config.toml"
+
+        with pytest.raises(ImportError, match="tomli-w is required"):
+            FormatHandler.to_path(config, path)
+
+
+def test_overwrite_truncates_existing_file():
+    """Test saving over a larger existing file replaces its contents."""
+    with TemporaryDirectory() as tmpdir:
+        for ext in (".json", ".toml", ".ini"):
+            path = Path(tmpdir) / f"config{ext}"
+            path.write_text("x" * 10000)
+
+            FormatHandler.to_path(SimpleConfig(name="short", value=1), path)
+
+            assert len(path.read_bytes()) < 10000
+            loaded = FormatHandler.from_path(SimpleConfig, path)
+            assert loaded.name == "short"
+
+
+def test_large_json_round_trip():
+    """Test files larger than a single read/write buffer."""
+    config = SimpleConfig(name="x" * 200_000, value=1)
+
+    with TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "large.json"
+
+        FormatHandler.to_path(config, path)
+        loaded = FormatHandler.from_path(SimpleConfig, path)
+
+        assert loaded.name == config.name
+
+
+@dataclassy
+class NumericConfig:
+    ratio: float
+    big: int = 0
+
 
-    try:
-        config = SimpleConfig(name="test", value=42)
+def test_json_non_finite_floats_round_trip():
+    """Test that NaN and infinities survive a JSON round trip."""
+    with TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "numbers.json"
 
-        with TemporaryDirectory() as tmpdir:
-            path = Path(tmpdir) / "config.toml"
+        for value in (float("nan"), float("inf"), float("-inf")):
+            FormatHandler.to_path(NumericConfig(ratio=value), path)
+            loaded = FormatHandler.from_path(NumericConfig, path)
 
-            with pytest.raises(ImportError, match="tomli-w is required"):
-                FormatHandler.to_path(config, path)
+            assert isinstance(loaded.ratio, float)
+            if math.isnan(value):
+                assert math.isnan(loaded.ratio)
+            else:
+                assert loaded.ratio == value
 
-    finally:
-        # Restore module
-        if tomli_w_module:
-            sys.modules["tomli_w"] = tomli_w_module
+
+def test_json_big_ints_round_trip():
+    """Test integers beyond 64 bits are written and read back exactly."""
+    with TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "numbers.json"
+
+        for value in (2**64, -(2**63) - 1, 10**30):
+            FormatHandler.to_path(NumericConfig(ratio=1.0, big=value), path)
+            loaded = FormatHandler.from_path(NumericConfig, path)
+
+            assert loaded.big == value
+            assert type(loaded.big) is int
+
+
+def test_json_long_numbers_load_like_json():
+    """Test long digit runs in floats, ints and strings load as json does."""
+    from dataclassy.serialization.formats import _load_json
+
+    documents = [
+        '{"ratio": 0.0011428193144282783, "exp": 1.5e-3000000000000000000}',
+        '{"big": -12345678901234567890123, "small": 1234567890123456789}',
+        "[18446744073709551616,0.00000000000000000001]",
+        '{"id": "1234567890123456789012345"}',
+        "123456789012345678901234567890",
+    ]
+    with TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "numbers.json"
+        for document in documents:
+            path.write_text(document)
+            loaded = _load_json(path)
+            expected = json.loads(document)
+            assert loaded == expected
+            assert json.dumps(loaded) == json.dumps(expected)
+
+
+def test_json_load_existing_nan_file():
+    """Test loading a JSON file with NaN/Infinity written by json.dump."""
+    with TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "numbers.json"
+        path.write_text(json.dumps({"ratio": float("nan"), "big": 3}))
+
+        loaded = FormatHandler.from_path(NumericConfig, path)
+        assert math.isnan(loaded.ratio)
+        assert loaded.big == 3
+
+        path.write_text('{"ratio": Infinity}')
+        assert FormatHandler.from_path(NumericConfig, path).ratio == math.inf
+
+
+def test_json_unsupported_types_rejected():
+    """Test that types json can't serialize fail the same way everywhere."""
+
+    @dataclassy
+    class Stamped:
+        when: datetime
+        ident: uuid.UUID
+
+    config = Stamped(when=datetime(2024, 1, 1), ident=uuid.uuid4())
+
+    with TemporaryDirectory() as tmpdir:
+        with pytest.raises(TypeError):
+            FormatHandler.to_path(config, Path(tmpdir) / "stamped.json")
 
 
 def test_path_accepts_string():
@@ -328,3 +453,26 @@ def test_json_preserves_types():
         assert isinstance(loaded.bool_val, bool)
         assert isinstance(loaded.list_val, list)
         assert isinstance(loaded.dict_val, dict)
+
+
+def test_to_paths_from_paths_round_trip():
+    """Test saving and loading several files at once."""
+    configs = [SimpleConfig(name=f"config{i}", value=i) for i in range(5)]
+
+    with TemporaryDirectory() as tmpdir:
+        paths = [Path(tmpdir) / f"config{i}.json" for i in range(5)]
+
+        FormatHandler.to_paths(configs, paths, workers=2)
+        loaded = FormatHandler.from_paths(SimpleConfig, paths, workers=2)
+
+        # Results come back in input order
+        assert [c.name for c in loaded] == [f"config{i}" for i in range(5)]
+        assert [c.value for c in loaded] == list(range(5))
+
+        with pytest.raises(FileNotFoundError, match="File not found"):
+            FormatHandler.from_paths(
+                SimpleConfig, paths + [Path(tmpdir) / "missing.json"]
+            )
+
+        with pytest.raises(ValueError, match="5 objects but 1 paths"):
+            FormatHandler.to_paths(configs, paths[:1])
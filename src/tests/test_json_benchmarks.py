@@ -0,0 +1,81 @@
+"""Benchmarks for the orjson-backed JSON helpers.
+
+The orjson paths do extra checks to stay identical to the json module;
+these tests catch those checks growing more expensive than the speedup
+they guard. They are marked slow, so run them with ``pytest -m ''``.
+"""
+
+import json
+import random
+import timeit
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from dataclassy.serialization import formats
+
+pytestmark = [
+    pytest.mark.slow,
+    pytest.mark.skipif(formats.orjson is None, reason="orjson required"),
+]
+
+
+def _best_time(func, number=20, repeat=5):
+    """Get the best time per call of func, in seconds."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def _config_data(numeric):
+    """Build config data of roughly 150-200 KB once written as JSON."""
+    rng = random.Random(0)
+    if numeric:
+        # Number-heavy data, including small floats with long digit runs
+        return {
+            "points": [
+                [rng.random() * 1000, rng.random() / 1000, rng.random()]
+                for _ in range(2500)
+            ]
+        }
+    return {
+        f"service{i}": {
+            "name": f"svc-{i}",
+            "port": 8000 + i,
+            "ratio": rng.random(),
+            "tags": ["a", "b", "c"],
+            "enabled": True,
+            "id": rng.randrange(10**12),
+        }
+        for i in range(1000)
+    }
+
+
+@pytest.mark.parametrize("numeric", [False, True], ids=["mixed", "numeric"])
+def test_load_json_faster_than_json(numeric):
+    """Test reading with orjson, checks included, beats json.loads."""
+    with TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "config.json"
+        path.write_text(json.dumps(_config_data(numeric), indent=2))
+
+        fast = _best_time(lambda: formats._load_json(path))
+        stdlib = _best_time(lambda: json.loads(path.read_bytes()))
+
+    assert fast < stdlib
+
+
+@pytest.mark.parametrize("numeric", [False, True], ids=["mixed", "numeric"])
+def test_dump_json_faster_than_json(numeric):
+    """Test writing with orjson, checks included, beats json.dump."""
+    data = _config_data(numeric)
+
+    def dump_stdlib():
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+    with TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "config.json"
+
+        fast = _best_time(lambda: formats._dump_json(data, path))
+        stdlib = _best_time(dump_stdlib)
+
+    assert fast < stdlib
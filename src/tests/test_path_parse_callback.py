@@ -182,3 +182,85 @@ def test_parse_callback_with_validation():
 
         with pytest.raises(ValueError, match="must have extension"):
             Config(config_file=str(txt_path))
+
+
+def test_parse_callback_skips_unchanged_file():
+    """Test that re-setting the same unchanged file reuses the parsed data."""
+    parse_calls = []
+
+    def tracking_parser(path: PathLib) -> dict:
+        content = json.loads(path.read_text())
+        parse_calls.append(content)
+        return content
+
+    @dataclassy
+    class Config:
+        config_file: Path = Path(parse_callback=tracking_parser)
+
+    with TemporaryDirectory() as tmpdir:
+        json_path = PathLib(tmpdir) / "config.json"
+        json_path.write_text('{"version": 1}')
+
+        config = Config(config_file=str(json_path))
+        assert len(parse_calls) == 1
+
+        # Same path, same contents - parser is not called again
+        config.config_file = str(json_path)
+        assert len(parse_calls) == 1
+        assert config.config_file_data == {"version": 1}
+
+        # File changed - parser runs again
+        json_path.write_text('{"version": 10}')
+        config.config_file = str(json_path)
+        assert len(parse_calls) == 2
+        assert config.config_file_data == {"version": 10}
+
+
+def test_parse_callback_unchanged_file_shares_data():
+    """Test that re-setting an unchanged file reuses the parsed object."""
+
+    def parse_json(path: PathLib) -> dict:
+        return json.loads(path.read_text())
+
+    @dataclassy
+    class Config:
+        config_file: Path = Path(parse_callback=parse_json)
+
+    with TemporaryDirectory() as tmpdir:
+        json_path = PathLib(tmpdir) / "config.json"
+        json_path.write_text('{"items": [1, 2]}')
+
+        config = Config(config_file=str(json_path))
+        first = config.config_file_data
+        first["items"].append(3)
+
+        # The same object comes back, changes included
+        config.config_file = str(json_path)
+        assert config.config_file_data is first
+        assert config.config_file_data == {"items": [1, 2, 3]}
+
+
+def test_parse_callback_failures_not_cached():
+    """Test that a failed parse is retried when the same file is set again."""
+    attempts = []
+
+    def flaky_parser(path: PathLib) -> dict:
+        attempts.append(path)
+        if len(attempts) == 1:
+            raise OSError("temporarily unavailable")
+        return json.loads(path.read_text())
+
+    @dataclassy
+    class Config:
+        config_file: Path = Path(parse_callback=flaky_parser)
+
+    with TemporaryDirectory() as tmpdir:
+        json_path = PathLib(tmpdir) / "config.json"
+        json_path.write_text('{"version": 1}')
+
+        config = Config(config_file=str(json_path))
+        assert config.config_file_data is None
+
+        config.config_file = str(json_path)
+        assert len(attempts) == 2
+        assert config.config_file_data == {"version": 1}
@@ -347,3 +347,63 @@ def test_roundtrip_conversion():
     assert person2.age == person.age
     assert person2.address.street == person.address.street
     assert person2.tags == person.tags
+
+
+def test_to_dict_matches_asdict():
+    """Test that to_dict produces the same result as dataclasses.asdict."""
+    from collections import namedtuple
+    from dataclasses import asdict
+
+    Pair = namedtuple("Pair", ["left", "right"])
+
+    @dataclassy
+    class Leaf:
+        value: int
+        color: Color = Color.RED
+
+    @dataclassy
+    class Tree:
+        name: str
+        leaves: List[Leaf]
+        index: Dict[str, Leaf]
+        pair: Pair
+        shape: tuple
+        parent: Optional[Leaf] = None
+
+    tree = Tree(
+        name="oak",
+        leaves=[Leaf(1), Leaf(2, Color.BLUE)],
+        index={"first": Leaf(1)},
+        pair=Pair(Leaf(3), [1, 2]),
+        shape=(1, "two", Leaf(4)),
+    )
+
+    data = tree.to_dict()
+
+    assert data == asdict(tree)
+    assert isinstance(data["pair"], Pair)
+    assert isinstance(data["shape"], tuple)
+    # Mutable values are copied, not shared
+    assert data["pair"].right is not tree.pair.right
+
+
+def test_from_dict_subclass_uses_own_fields():
+    """Test that a subclass converted after its base gets its own fields."""
+
+    @dataclassy
+    class Base:
+        name: str
+        count: int = 0
+
+    @dataclassy
+    class Child(Base):
+        ratio: float = 1.0
+
+    base = Base.from_dict({"name": "base", "count": "2"})
+    assert base == Base(name="base", count=2)
+
+    child = Child.from_dict({"name": "child", "ratio": "0.5"})
+    assert child == Child(name="child", count=0, ratio=0.5)
+
+    # Converting the base again still builds a base instance
+    assert type(Base.from_dict({"name": "again"})) is Base
@@ -1,11 +1,15 @@
 """Tests for the settings decorator."""
 
 import json
+import math
 import os
+import sys
 from pathlib import Path
-from tempfile import TemporaryDirectory
+
+import pytest
 
 from dataclassy import settings
+from dataclassy.testing import env_patch
 
 
 def test_basic_settings():
@@ -31,7 +35,7 @@ def test_basic_settings():
     assert hasattr(config, "save_config")
 
 
-def test_load_from_json():
+def test_load_from_json(tmp_path):
     """Test loading configuration from JSON file."""
 
     @settings(config_name="app", auto_load=False)
@@ -40,25 +44,24 @@ def test_load_from_json():
         database_url: str = "sqlite:///default.db"
         timeout: int = 30
 
-    with TemporaryDirectory() as tmpdir:
-        # Create config file
-        config_path = Path(tmpdir) / "app.json"
-        config_path.write_text(
-            json.dumps(
-                {
-                    "debug": True,
-                    "database_url": "postgres://localhost/myapp",
-                    "timeout": 60,
-                }
-            )
+    # Create config file
+    config_path = tmp_path / "app.json"
+    config_path.write_text(
+        json.dumps(
+            {
+                "debug": True,
+                "database_url": "postgres://localhost/myapp",
+                "timeout": 60,
+            }
         )
+    )
 
-        # Load config
-        config = AppConfig.load_config([config_path])
+    # Load config
+    config = AppConfig.load_config([config_path])
 
-        assert config.debug is True
-        assert config.database_url == "postgres://localhost/myapp"
-        assert config.timeout == 60
+    assert config.debug is True
+    assert config.database_url == "postgres://localhost/myapp"
+    assert config.timeout == 60
 
 
 def test_environment_variables():
@@ -71,24 +74,61 @@ def test_environment_variables():
         api_key: str = "default"
 
     # Set environment variables
-    os.environ["MYAPP_DEBUG"] = "true"
-    os.environ["MYAPP_PORT"] = "9090"
-    os.environ["MYAPP_API_KEY"] = "secret123"
-
-    try:
+    with env_patch(
+        MYAPP_DEBUG="true", MYAPP_PORT="9090", MYAPP_API_KEY="secret123"
+    ):
         config = AppConfig.load_config()
 
         assert config.debug is True
         assert config.port == 9090
         assert config.api_key == "secret123"
-    finally:
-        # Cleanup
-        del os.environ["MYAPP_DEBUG"]
-        del os.environ["MYAPP_PORT"]
-        del os.environ["MYAPP_API_KEY"]
 
 
-def test_config_cascading():
+def test_case_insensitive_environment_variables():
+    """Test env var names match regardless of case by default."""
+
+    @settings(env_prefix="CI_", auto_load=False)
+    class InsensitiveConfig:
+        port: int = 8000
+
+    with env_patch(ci_Port="9090"):
+        config = InsensitiveConfig.load_config()
+        assert config.port == 9090
+
+
+def test_changed_env_prefix():
+    """Test a prefix changed after decoration is used for env vars."""
+
+    @settings(env_prefix="A_", auto_load=False)
+    class PrefixConfig:
+        x: int = 1
+
+    PrefixConfig._settings_config["env_prefix"] = "B_"
+    with env_patch(A_X="3", B_X="5"):
+        assert PrefixConfig.load_config().x == 5
+
+    PrefixConfig._settings_config["env_prefix"] = "A_"
+    with env_patch(A_X="3", B_X="5"):
+        assert PrefixConfig.load_config().x == 3
+
+
+def test_case_sensitive_environment_variables():
+    """Test case-sensitive env var matching."""
+
+    @settings(env_prefix="CS_", case_sensitive=True, auto_load=False)
+    class SensitiveConfig:
+        port: int = 8000
+        host: str = "localhost"
+
+    with env_patch(CS_PORT="9090", cs_host="example.com"):
+        config = SensitiveConfig.load_config()
+
+        assert config.port == 9090
+        # Lowercase name doesn't match when case-sensitive
+        assert config.host == "localhost"
+
+
+def test_config_cascading(tmp_path):
     """Test configuration cascading with merge."""
 
     @settings(auto_load=False)
@@ -97,67 +137,103 @@ def test_config_cascading():
         debug: bool = False
         database: dict = None
 
-    with TemporaryDirectory() as tmpdir:
-        # Create default config
-        default_config = Path(tmpdir) / "default.json"
-        default_config.write_text(
-            json.dumps(
-                {
-                    "name": "myapp",
-                    "debug": False,
-                    "database": {
-                        "host": "localhost",
-                        "port": 5432,
-                        "name": "myapp_db",
-                    },
-                }
-            )
+    # Create default config
+    default_config = tmp_path / "default.json"
+    default_config.write_text(
+        json.dumps(
+            {
+                "name": "myapp",
+                "debug": False,
+                "database": {
+                    "host": "localhost",
+                    "port": 5432,
+                    "name": "myapp_db",
+                },
+            }
         )
+    )
 
-        # Create user config (overrides some values)
-        user_config = Path(tmpdir) / "user.json"
-        user_config.write_text(
-            json.dumps({"debug": True, "database": {"host": "db.example.com"}})
-        )
+    # Create user config (overrides some values)
+    user_config = tmp_path / "user.json"
+    user_config.write_text(
+        json.dumps({"debug": True, "database": {"host": "db.example.com"}})
+    )
 
-        # Load with cascading
-        config = Config.load_config([default_config, user_config])
+    # Load with cascading
+    config = Config.load_config([default_config, user_config])
 
-        assert config.name == "myapp"  # From default
-        assert config.debug is True  # Overridden by user
-        assert config.database["host"] == "db.example.com"  # Overridden
-        assert config.database["port"] == 5432  # From default
-        assert config.database["name"] == "myapp_db"  # From default
+    assert config.name == "myapp"  # From default
+    assert config.debug is True  # Overridden by user
+    assert config.database["host"] == "db.example.com"  # Overridden
+    assert config.database["port"] == 5432  # From default
+    assert config.database["name"] == "myapp_db"  # From default
 
 
-def test_auto_search_config_files():
+def test_auto_search_config_files(tmp_path):
     """Test automatic config file search."""
-    with TemporaryDirectory() as tmpdir:
-        # Change to temp directory
-        original_cwd = os.getcwd()
-        os.chdir(tmpdir)
+    # Change to temp directory
+    original_cwd = os.getcwd()
+    os.chdir(tmp_path)
+
+    try:
+
+        @settings(config_name="settings", auto_load=False)
+        class Settings:
+            app_name: str = "default"
+            version: str = "1.0.0"
 
-        try:
+        # Create config file in current directory - use JSON since YAML might not be installed
+        config_path = Path("settings.json")
+        config_path.write_text('{"app_name": "MyApp", "version": "2.0.0"}')
 
-            @settings(config_name="settings", auto_load=False)
-            class Settings:
-                app_name: str = "default"
-                version: str = "1.0.0"
+        # Load should find it automatically
+        config = Settings.load_config()
 
-            # Create config file in current directory - use JSON since YAML might not be installed
-            config_path = Path("settings.json")
-            config_path.write_text('{"app_name": "MyApp", "version": "2.0.0"}')
+        assert config.app_name == "MyApp"
+        assert config.version == "2.0.0"
+    finally:
+        os.chdir(original_cwd)
+
+
+def test_auto_search_multiple_dirs(tmp_path):
+    """Test config search across directories, in extension order."""
+    (tmp_path / "app.ini").write_text("[DEFAULT]\nport = 9000\n")
+    (tmp_path / "app.json").write_text('{"name": "json", "port": 8080}')
+    # A directory with a matching name is not a config file
+    (tmp_path / "app.toml").mkdir()
+
+    @settings(
+        config_name="app",
+        search_dirs=[tmp_path / "missing", tmp_path],
+        auto_load=False,
+    )
+    class AppSettings:
+        name: str = "default"
+        port: int = 8000
 
-            # Load should find it automatically
-            config = Settings.load_config()
+    config = AppSettings.load_config()
+
+    # INI is loaded after JSON, so its port wins
+    assert config.name == "json"
+    assert config.port == 9000
 
-            assert config.app_name == "MyApp"
-            assert config.version == "2.0.0"
-        finally:
-            os.chdir(original_cwd)
 
+def test_auto_search_matches_filesystem_case(tmp_path):
+    """Test config file names are matched as the filesystem resolves them."""
+    (tmp_path / "App.JSON").write_text('{"name": "found"}')
+    # Only a case-insensitive filesystem resolves the lowercase name
+    case_insensitive = (tmp_path / "app.json").exists()
 
-def test_save_config():
+    @settings(config_name="app", search_dirs=[tmp_path], auto_load=False)
+    class AppSettings:
+        name: str = "default"
+
+    config = AppSettings.load_config()
+
+    assert config.name == ("found" if case_insensitive else "default")
+
+
+def test_save_config(tmp_path):
     """Test saving configuration to file."""
 
     @settings
@@ -170,19 +246,18 @@ def test_save_config():
 
     config = Config(name="mytest", enabled=False, count=100)
 
-    with TemporaryDirectory() as tmpdir:
-        save_path = Path(tmpdir) / "saved.json"
+    save_path = tmp_path / "saved.json"
 
-        config.save_config(save_path)
+    config.save_config(save_path)
 
-        # Verify saved content
-        saved_data = json.loads(save_path.read_text())
-        assert saved_data["name"] == "mytest"
-        assert saved_data["enabled"] is False
-        assert saved_data["count"] == 100
+    # Verify saved content
+    saved_data = json.loads(save_path.read_text())
+    assert saved_data["name"] == "mytest"
+    assert saved_data["enabled"] is False
+    assert saved_data["count"] == 100
 
 
-def test_save_without_defaults():
+def test_save_without_defaults(tmp_path):
     """Test saving only non-default values."""
 
     @settings
@@ -194,42 +269,152 @@ def test_save_without_defaults():
     # Only change one value
     config = Config(name="default_name", port=9000, custom_value="custom")
 
-    with TemporaryDirectory() as tmpdir:
-        save_path = Path(tmpdir) / "minimal.json"
+    save_path = tmp_path / "minimal.json"
+
+    config.save_config(
+        save_path, include_defaults=False, include_comments=False
+    )
+
+    # Should only save the changed value
+    saved_data = json.loads(save_path.read_text())
+    assert "name" not in saved_data  # Same as default
+    assert saved_data["port"] == 9000  # Changed
+    assert "custom_value" not in saved_data  # Same as default
+
+
+def test_save_without_factory_defaults(tmp_path):
+    """Test default_factory fields are compared against their defaults."""
+    from dataclasses import field
+
+    @settings(auto_load=False)
+    class Config:
+        name: str
+        tags: list = field(default_factory=list)
+        limits: dict = field(default_factory=dict)
+
+    config = Config(name="app", tags=["a"])
+
+    save_path = tmp_path / "minimal.json"
 
+    # Save twice to exercise the cached defaults
+    for _ in range(2):
         config.save_config(
             save_path, include_defaults=False, include_comments=False
         )
 
-        # Should only save the changed value
         saved_data = json.loads(save_path.read_text())
-        assert "name" not in saved_data  # Same as default
-        assert saved_data["port"] == 9000  # Changed
-        assert "custom_value" not in saved_data  # Same as default
+        assert saved_data == {"name": "app", "tags": ["a"]}
+
+
+def test_non_finite_floats_round_trip(tmp_path):
+    """Test NaN and infinity survive save_config and load_config."""
+
+    @settings(auto_load=False)
+    class Config:
+        name: str = "default"
+        ratio: float = 1.0
+
+    # A file written by json.dumps, which spells NaN as a bare literal
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"name": "custom", "ratio": math.nan}))
+
+    config = Config.load_config(config_paths=[config_path])
+    assert config.name == "custom"
+    assert math.isnan(config.ratio)
+
+    save_path = tmp_path / "saved.json"
+    Config(name="custom", ratio=math.inf).save_config(
+        save_path, include_comments=False
+    )
+
+    loaded = Config.load_config(config_paths=[save_path])
+    assert loaded.ratio == math.inf
+
+
+def test_invalid_config_file_raises(tmp_path):
+    """Test a config file that can't be parsed isn't silently skipped."""
+
+    @settings(auto_load=False)
+    class Config:
+        name: str = "default"
+
+    config_path = tmp_path / "config.json"
+    config_path.write_text('{"name": ')
+
+    with pytest.raises(ValueError):
+        Config.load_config(config_paths=[config_path])
+
+    # Missing files are still skipped
+    config = Config.load_config(config_paths=[tmp_path / "missing.json"])
+    assert config.name == "default"
+
 
+def test_unloadable_config_files_skipped(tmp_path, monkeypatch):
+    """Test files that can't be read or have no content are skipped."""
 
-def test_reload_config():
+    @settings(auto_load=False)
+    class Config:
+        name: str = "default"
+
+    empty = tmp_path / "empty.json"
+    empty.write_text("")
+    directory = tmp_path / "dir.json"
+    directory.mkdir()
+    yaml_file = tmp_path / "config.yaml"
+    yaml_file.write_text("name: yaml\n")
+    toml_file = tmp_path / "config.toml"
+    toml_file.write_text('name = "toml"\n')
+
+    # Formats whose optional library is missing are skipped too
+    monkeypatch.setitem(sys.modules, "yaml", None)
+    monkeypatch.setitem(sys.modules, "tomllib", None)
+    monkeypatch.setitem(sys.modules, "tomli", None)
+
+    config = Config.load_config(
+        config_paths=[empty, directory, yaml_file, toml_file]
+    )
+    assert config.name == "default"
+
+
+def test_reload_config(tmp_path):
     """Test reloading configuration."""
 
     @settings(auto_load=False)
     class Config:
         value: int = 0
 
-    with TemporaryDirectory() as tmpdir:
-        config_path = Path(tmpdir) / "config.json"
-        config_path.write_text('{"value": 10}')
+    config_path = tmp_path / "config.json"
+    config_path.write_text('{"value": 10}')
 
-        # Load initially
-        Config._settings_config["config_paths"] = [config_path]
-        config = Config.load_config()
-        assert config.value == 10
+    # Load initially
+    Config._settings_config["config_paths"] = [config_path]
+    config = Config.load_config()
+    assert config.value == 10
 
-        # Change the file
-        config_path.write_text('{"value": 20}')
+    # Change the file
+    config_path.write_text('{"value": 20}')
 
-        # Reload
-        config.reload()
-        assert config.value == 20
+    # Reload
+    config.reload()
+    assert config.value == 20
+
+
+def test_repeated_loads_are_independent(tmp_path):
+    """Test that loading the same file twice doesn't share mutable values."""
+
+    @settings(auto_load=False)
+    class Config:
+        features: dict = None
+
+    config_path = tmp_path / "config.json"
+    config_path.write_text('{"features": {"search": true}}')
+
+    Config._settings_config["config_paths"] = [config_path]
+    first = Config.load_config()
+    first.features["search"] = False
+
+    second = Config.load_config()
+    assert second.features == {"search": True}
 
 
 def test_nested_environment_variables():
@@ -241,20 +426,16 @@ def test_nested_environment_variables():
         database_host: str = "localhost"
         database_port: int = 5432
 
-    os.environ["APP_DEBUG"] = "true"
-    os.environ["APP_DATABASE_HOST"] = "db.example.com"
-    os.environ["APP_DATABASE_PORT"] = "3306"
-
-    try:
+    with env_patch(
+        APP_DEBUG="true",
+        APP_DATABASE_HOST="db.example.com",
+        APP_DATABASE_PORT="3306",
+    ):
         config = Config.load_config()
 
         assert config.debug is True
         assert config.database_host == "db.example.com"
         assert config.database_port == 3306
-    finally:
-        del os.environ["APP_DEBUG"]
-        del os.environ["APP_DATABASE_HOST"]
-        del os.environ["APP_DATABASE_PORT"]
 
 
 def test_override_values():
@@ -279,9 +460,7 @@ def test_auto_load_empty_init():
     class AutoConfig:
         value: str = "default"
 
-    os.environ["TEST_VALUE"] = "from_env"
-
-    try:
+    with env_patch(TEST_VALUE="from_env"):
         # Creating with no args should auto-load
         config = AutoConfig()
         assert config.value == "from_env"
@@ -289,11 +468,9 @@ def test_auto_load_empty_init():
         # Creating with args should use them
         config2 = AutoConfig(value="explicit")
         assert config2.value == "explicit"
-    finally:
-        del os.environ["TEST_VALUE"]
 
 
-def test_multiple_format_support():
+def test_multiple_format_support(tmp_path):
     """Test loading from different file formats."""
 
     @settings(auto_load=False)
@@ -301,25 +478,24 @@ def test_multiple_format_support():
         format_type: str = "unknown"
         value: int = 0
 
-    with TemporaryDirectory() as tmpdir:
-        # Test JSON
-        json_path = Path(tmpdir) / "config.json"
-        json_path.write_text('{"format_type": "json", "value": 1}')
+    # Test JSON
+    json_path = tmp_path / "config.json"
+    json_path.write_text('{"format_type": "json", "value": 1}')
 
-        config = Config.load_config([json_path])
-        assert config.format_type == "json"
-        assert config.value == 1
+    config = Config.load_config([json_path])
+    assert config.format_type == "json"
+    assert config.value == 1
 
-        # Test INI
-        ini_path = Path(tmpdir) / "config.ini"
-        ini_path.write_text("[DEFAULT]\nformat_type = ini\nvalue = 2\n")
+    # Test INI
+    ini_path = tmp_path / "config.ini"
+    ini_path.write_text("[DEFAULT]\nformat_type = ini\nvalue = 2\n")
 
-        config = Config.load_config([ini_path])
-        assert config.format_type == "ini"
-        assert config.value == 2
+    config = Config.load_config([ini_path])
+    assert config.format_type == "ini"
+    assert config.value == 2
 
 
-def test_comment_preservation():
+def test_comment_preservation(tmp_path):
     """Test that docstrings are preserved as comments."""
 
     @settings
@@ -331,12 +507,11 @@ def test_comment_preservation():
 
     config = ConfigWithDocs()
 
-    with TemporaryDirectory() as tmpdir:
-        save_path = Path(tmpdir) / "with_comments.json"
-        config.save_config(save_path, include_comments=True)
+    save_path = tmp_path / "with_comments.json"
+    config.save_config(save_path, include_comments=True)
 
-        # Check that comment was added
-        saved_text = save_path.read_text()
-        saved_data = json.loads(saved_text)
-        assert "_comment" in saved_data
-        assert saved_data["_comment"] == "This is the main configuration."
+    # Check that comment was added
+    saved_text = save_path.read_text()
+    saved_data = json.loads(saved_text)
+    assert "_comment" in saved_data
+    assert saved_data["_comment"] == "This is the main configuration."
@@ -1,11 +1,10 @@
 """Tests for enhanced environment variable type coercion in settings."""
 
 import os
-from typing import List, Dict, Optional
-from tempfile import TemporaryDirectory
-from pathlib import Path
+from typing import List, Dict, Optional, Union
 
 from dataclassy import settings
+from dataclassy.testing import env_patch
 
 
 def test_env_list_basic():
@@ -18,16 +17,10 @@ def test_env_list_basic():
         ports: List[int] = field(default_factory=list)
 
     # Set environment variables
-    os.environ["TEST_TAGS"] = "prod,staging,dev"
-    os.environ["TEST_PORTS"] = "8080,8081,8082"
-
-    try:
+    with env_patch(TEST_TAGS="prod,staging,dev", TEST_PORTS="8080,8081,8082"):
         config = Config.load_config()
         assert config.tags == ["prod", "staging", "dev"]
         assert config.ports == [8080, 8081, 8082]
-    finally:
-        del os.environ["TEST_TAGS"]
-        del os.environ["TEST_PORTS"]
 
 
 def test_env_list_with_spaces():
@@ -38,13 +31,9 @@ def test_env_list_with_spaces():
     class Config:
         items: List[str] = field(default_factory=list)
 
-    os.environ["TEST_ITEMS"] = "item 1, item 2 , item 3"
-
-    try:
+    with env_patch(TEST_ITEMS="item 1, item 2 , item 3"):
         config = Config.load_config()
         assert config.items == ["item 1", "item 2", "item 3"]
-    finally:
-        del os.environ["TEST_ITEMS"]
 
 
 def test_env_list_typed():
@@ -56,16 +45,10 @@ def test_env_list_typed():
         numbers: List[float] = field(default_factory=list)
         flags: List[bool] = field(default_factory=list)
 
-    os.environ["TEST_NUMBERS"] = "1.5,2.7,3.14"
-    os.environ["TEST_FLAGS"] = "true,false,yes,no"
-
-    try:
+    with env_patch(TEST_NUMBERS="1.5,2.7,3.14", TEST_FLAGS="true,false,yes,no"):
         config = Config.load_config()
         assert config.numbers == [1.5, 2.7, 3.14]
         assert config.flags == [True, False, True, False]
-    finally:
-        del os.environ["TEST_NUMBERS"]
-        del os.environ["TEST_FLAGS"]
 
 
 def test_env_dict_key_value_pairs():
@@ -77,12 +60,10 @@ def test_env_dict_key_value_pairs():
         headers: Dict[str, str] = field(default_factory=dict)
         settings: Dict[str, int] = field(default_factory=dict)
 
-    os.environ["TEST_HEADERS"] = (
-        "Content-Type=application/json,Authorization=Bearer token"
-    )
-    os.environ["TEST_SETTINGS"] = "timeout=30,retries=3,max_connections=100"
-
-    try:
+    with env_patch(
+        TEST_HEADERS="Content-Type=application/json,Authorization=Bearer token",
+        TEST_SETTINGS="timeout=30,retries=3,max_connections=100",
+    ):
         config = Config.load_config()
         assert config.headers == {
             "Content-Type": "application/json",
@@ -93,9 +74,6 @@ def test_env_dict_key_value_pairs():
             "retries": 3,
             "max_connections": 100,
         }
-    finally:
-        del os.environ["TEST_HEADERS"]
-        del os.environ["TEST_SETTINGS"]
 
 
 def test_env_dict_json_format():
@@ -106,15 +84,11 @@ def test_env_dict_json_format():
     class Config:
         metadata: Dict[str, any] = field(default_factory=dict)
 
-    os.environ["TEST_METADATA"] = (
-        '{"version": "1.0", "debug": true, "count": 42}'
-    )
-
-    try:
+    with env_patch(
+        TEST_METADATA='{"version": "1.0", "debug": true, "count": 42}'
+    ):
         config = Config.load_config()
         assert config.metadata == {"version": "1.0", "debug": True, "count": 42}
-    finally:
-        del os.environ["TEST_METADATA"]
 
 
 def test_env_dict_typed_values():
@@ -126,10 +100,10 @@ def test_env_dict_typed_values():
         scores: Dict[str, float] = field(default_factory=dict)
         flags: Dict[str, bool] = field(default_factory=dict)
 
-    os.environ["TEST_SCORES"] = "math=95.5,science=87.3,english=91.0"
-    os.environ["TEST_FLAGS"] = "feature_a=true,feature_b=false,feature_c=yes"
-
-    try:
+    with env_patch(
+        TEST_SCORES="math=95.5,science=87.3,english=91.0",
+        TEST_FLAGS="feature_a=true,feature_b=false,feature_c=yes",
+    ):
         config = Config.load_config()
         assert config.scores == {"math": 95.5, "science": 87.3, "english": 91.0}
         assert config.flags == {
@@ -137,9 +111,6 @@ def test_env_dict_typed_values():
             "feature_b": False,
             "feature_c": True,
         }
-    finally:
-        del os.environ["TEST_SCORES"]
-        del os.environ["TEST_FLAGS"]
 
 
 def test_env_optional_types():
@@ -152,34 +123,18 @@ def test_env_optional_types():
         items: Optional[List[str]] = None
 
     # Test with values
-    os.environ["TEST_NAME"] = "myapp"
-    os.environ["TEST_PORT"] = "8080"
-    os.environ["TEST_ITEMS"] = "a,b,c"
-
-    try:
+    with env_patch(TEST_NAME="myapp", TEST_PORT="8080", TEST_ITEMS="a,b,c"):
         config = Config.load_config()
         assert config.name == "myapp"
         assert config.port == 8080
         assert config.items == ["a", "b", "c"]
-    finally:
-        del os.environ["TEST_NAME"]
-        del os.environ["TEST_PORT"]
-        del os.environ["TEST_ITEMS"]
 
     # Test with null values
-    os.environ["TEST_NAME"] = "none"
-    os.environ["TEST_PORT"] = "null"
-    os.environ["TEST_ITEMS"] = ""
-
-    try:
+    with env_patch(TEST_NAME="none", TEST_PORT="null", TEST_ITEMS=""):
         config = Config.load_config()
         assert config.name is None
         assert config.port is None
         assert config.items == []  # Empty list for empty string
-    finally:
-        del os.environ["TEST_NAME"]
-        del os.environ["TEST_PORT"]
-        del os.environ["TEST_ITEMS"]
 
 
 def test_env_empty_collections():
@@ -194,19 +149,13 @@ def test_env_empty_collections():
         )
 
     # Empty values should create empty collections
-    os.environ["TEST_TAGS"] = ""
-    os.environ["TEST_METADATA"] = ""
-
-    try:
+    with env_patch(TEST_TAGS="", TEST_METADATA=""):
         config = Config.load_config()
         assert config.tags == []
         assert config.metadata == {}
-    finally:
-        del os.environ["TEST_TAGS"]
-        del os.environ["TEST_METADATA"]
 
 
-def test_env_complex_nested():
+def test_env_complex_nested(tmp_path):
     """Test complex nested scenarios."""
     from dataclasses import field
 
@@ -219,15 +168,13 @@ def test_env_complex_nested():
         admin_email: Optional[str] = None
 
     # Set all environment variables
-    os.environ["APP_SERVERS"] = (
-        "api.example.com,web.example.com,admin.example.com"
-    )
-    os.environ["APP_PORTS"] = "8080,8081,8082"
-    os.environ["APP_FEATURES"] = "auth=true,logging=true,caching=false"
-    os.environ["APP_LIMITS"] = "max_requests=1000,timeout=30,retries=3"
-    os.environ["APP_ADMIN_EMAIL"] = "admin@example.com"
-
-    try:
+    with env_patch(
+        APP_SERVERS="api.example.com,web.example.com,admin.example.com",
+        APP_PORTS="8080,8081,8082",
+        APP_FEATURES="auth=true,logging=true,caching=false",
+        APP_LIMITS="max_requests=1000,timeout=30,retries=3",
+        APP_ADMIN_EMAIL="admin@example.com",
+    ):
         config = Config.load_config()
 
         assert config.servers == [
@@ -249,26 +196,13 @@ def test_env_complex_nested():
         assert config.admin_email == "admin@example.com"
 
         # Save and verify round-trip
-        with TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "config.json"
-            config.save_config(config_path)
-
-            # Load from file (not env vars this time)
-            loaded = Config.load_config(
-                config_paths=[config_path], load_env=False
-            )
-            assert loaded.servers == config.servers
-            assert loaded.features == config.features
-    finally:
-        for key in [
-            "APP_SERVERS",
-            "APP_PORTS",
-            "APP_FEATURES",
-            "APP_LIMITS",
-            "APP_ADMIN_EMAIL",
-        ]:
-            if key in os.environ:
-                del os.environ[key]
+        config_path = tmp_path / "config.json"
+        config.save_config(config_path)
+
+        # Load from file (not env vars this time)
+        loaded = Config.load_config(config_paths=[config_path], load_env=False)
+        assert loaded.servers == config.servers
+        assert loaded.features == config.features
 
 
 def test_env_invalid_conversions():
@@ -282,11 +216,11 @@ def test_env_invalid_conversions():
         items: List[int] = field(default_factory=list)
 
     # Set invalid values
-    os.environ["TEST_PORT"] = "not_a_number"
-    os.environ["TEST_RATIO"] = "invalid"
-    os.environ["TEST_ITEMS"] = "1,2,not_a_number,4"
-
-    try:
+    with env_patch(
+        TEST_PORT="not_a_number",
+        TEST_RATIO="invalid",
+        TEST_ITEMS="1,2,not_a_number,4",
+    ):
         config = Config.load_config()
         # Invalid values should be skipped, defaults used
         assert config.port == 8080
@@ -294,10 +228,31 @@ def test_env_invalid_conversions():
         # For lists, individual items might fail
         # Our implementation will fail on the whole list if any item fails
         assert config.items == []  # Default when conversion fails
-    finally:
-        del os.environ["TEST_PORT"]
-        del os.environ["TEST_RATIO"]
-        del os.environ["TEST_ITEMS"]
+
+
+def test_env_union_order_not_shared_between_classes():
+    """Test that Union members in a different order convert differently."""
+
+    @settings(env_prefix="TEST_")
+    class BoolFirst:
+        level: Union[bool, int] = 0
+        code: Union[int, str] = 0
+
+    @settings(env_prefix="TEST_")
+    class IntFirst:
+        level: Union[int, bool] = 0
+        code: Union[str, int] = ""
+
+    # Union[bool, int] == Union[int, bool], so a converter cached by type
+    # alone would be reused for the other order
+    with env_patch(TEST_LEVEL="1", TEST_CODE="42"):
+        bool_first = BoolFirst.load_config()
+        int_first = IntFirst.load_config()
+
+    assert bool_first.level is True
+    assert bool_first.code == 42
+    assert int_first.level == 1 and int_first.level is not True
+    assert int_first.code == "42"
 
 
 def test_env_dict_with_equals_in_value():
@@ -308,18 +263,14 @@ def test_env_dict_with_equals_in_value():
     class Config:
         connection_strings: Dict[str, str] = field(default_factory=dict)
 
-    os.environ["TEST_CONNECTION_STRINGS"] = (
-        "db=host=localhost;port=5432,cache=redis://localhost:6379"
-    )
-
-    try:
+    with env_patch(
+        TEST_CONNECTION_STRINGS="db=host=localhost;port=5432,cache=redis://localhost:6379"
+    ):
         config = Config.load_config()
         assert config.connection_strings == {
             "db": "host=localhost;port=5432",
             "cache": "redis://localhost:6379",
         }
-    finally:
-        del os.environ["TEST_CONNECTION_STRINGS"]
 
 
 def test_env_list_single_item():
@@ -330,16 +281,12 @@ def test_env_list_single_item():
     class Config:
         tags: List[str] = field(default_factory=list)
 
-    os.environ["TEST_TAGS"] = "production"
-
-    try:
+    with env_patch(TEST_TAGS="production"):
         config = Config.load_config()
         assert config.tags == ["production"]
-    finally:
-        del os.environ["TEST_TAGS"]
 
 
-def test_env_integration_with_file_config():
+def test_env_integration_with_file_config(tmp_path):
     """Test that env vars properly override file config."""
     from dataclasses import field
 
@@ -349,31 +296,31 @@ def test_env_integration_with_file_config():
         items: List[str] = field(default_factory=list)
         settings: Dict[str, int] = field(default_factory=dict)
 
-    with TemporaryDirectory() as tmpdir:
-        # Create config file
-        config_path = Path(tmpdir) / "app.json"
-        import json
-
-        with open(config_path, "w") as f:
-            json.dump(
-                {
-                    "name": "from_file",
-                    "items": ["file_item1", "file_item2"],
-                    "settings": {"file_setting": 10},
-                },
-                f,
-            )
-
-        # Set env vars that should override
-        os.environ["TEST_NAME"] = "from_env"
-        os.environ["TEST_ITEMS"] = "env_item1,env_item2,env_item3"
-        os.environ["TEST_SETTINGS"] = "env_setting=20,other=30"
+    # Create config file
+    config_path = tmp_path / "app.json"
+    import json
+
+    with open(config_path, "w") as f:
+        json.dump(
+            {
+                "name": "from_file",
+                "items": ["file_item1", "file_item2"],
+                "settings": {"file_setting": 10},
+            },
+            f,
+        )
 
-        try:
-            # Change to tmpdir to find config file
-            original_cwd = os.getcwd()
-            os.chdir(tmpdir)
+    # Set env vars that should override
+    with env_patch(
+        TEST_NAME="from_env",
+        TEST_ITEMS="env_item1,env_item2,env_item3",
+        TEST_SETTINGS="env_setting=20,other=30",
+    ):
+        # Change to tmp_path to find config file
+        original_cwd = os.getcwd()
+        os.chdir(tmp_path)
 
+        try:
             config = Config.load_config()
 
             # Env vars should override file values
@@ -382,6 +329,3 @@ def test_env_integration_with_file_config():
             assert config.settings == {"env_setting": 20, "other": 30}
         finally:
             os.chdir(original_cwd)
-            del os.environ["TEST_NAME"]
-            del os.environ["TEST_ITEMS"]
-            del os.environ["TEST_SETTINGS"]
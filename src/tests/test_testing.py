@@ -0,0 +1,34 @@
+"""Tests for the dataclassy testing helpers."""
+
+import os
+
+import pytest
+
+from dataclassy.testing import env_patch
+
+
+def test_env_patch_restores_environment():
+    """Test env_patch sets variables and restores the previous state."""
+    os.environ["ENV_PATCH_EXISTING"] = "before"
+    os.environ.pop("ENV_PATCH_NEW", None)
+
+    try:
+        with env_patch(
+            {"ENV_PATCH_EXISTING": "during"},
+            ENV_PATCH_NEW="added",
+        ):
+            assert os.environ["ENV_PATCH_EXISTING"] == "during"
+            assert os.environ["ENV_PATCH_NEW"] == "added"
+
+        assert os.environ["ENV_PATCH_EXISTING"] == "before"
+        assert "ENV_PATCH_NEW" not in os.environ
+
+        # None unsets a variable for the duration of the block
+        with pytest.raises(RuntimeError):
+            with env_patch(ENV_PATCH_EXISTING=None):
+                assert "ENV_PATCH_EXISTING" not in os.environ
+                raise RuntimeError("restored even on errors")
+
+        assert os.environ["ENV_PATCH_EXISTING"] == "before"
+    finally:
+        os.environ.pop("ENV_PATCH_EXISTING", None)